@@ -0,0 +1,306 @@
+import uuid
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import and_, delete, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, models
+from app.auth import get_current_user_id_async, resolve_user_id_async, token_cache
+from app.database import get_async_db
+from app.pagination import (
+    check_limit,
+    decode_datetime_id_cursor,
+    decode_id_cursor,
+    encode_cursor,
+    fetch_limit,
+    page_limit,
+)
+from app.schemas import (
+    SessionResponse,
+    User,
+    UserAnswerCreate,
+    UserAnswerDetailResponse,
+    UserAnswerDetailResponseChild,
+    UserAnswerResponse,
+    UserAnswerResponseChild,
+    UserCreate,
+    UserLogin,
+    UserTagStatsResponse,
+    UserTagStatsResponseChild,
+)
+
+# app.mainのユーザー・履歴系ルートのAsyncSession版（USE_ASYNC_DB=1のときに使う）
+router = APIRouter()
+
+
+async def get_user(db: AsyncSession, user_id: int) -> models.UserModel:
+    db_user = await db.get(models.UserModel, user_id)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return db_user
+
+
+@router.post("/users/", response_model=User)
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    db_user = await db.scalar(
+        select(models.UserModel).where(models.UserModel.email == user.email)
+    )
+    if db_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    new_user = models.UserModel(
+        name=user.name, email=user.email, password=user.password
+    )
+    db.add(new_user)
+    await db.commit()
+    await db.refresh(new_user)
+    return new_user
+
+
+@router.get("/users/{user_id}", response_model=User)
+async def read_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await get_user(db, user_id)
+
+
+@router.get("/users/", response_model=List[User])
+async def read_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    check_limit(limit)
+    query = select(models.UserModel).order_by(models.UserModel.id)
+    if cursor is not None:
+        query = query.where(models.UserModel.id > decode_id_cursor(cursor))
+    elif skip:
+        query = query.offset(skip)
+    users = (await db.scalars(query.limit(limit + 1))).all()
+    if len(users) > limit:
+        users = users[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(users[-1].id)
+    return users
+
+
+@router.get("/users/me/stats", response_model=UserTagStatsResponse)
+async def read_user_tag_stats(
+    user_id: int = Depends(get_current_user_id_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    stats = (await db.scalars(crud.tag_stats_query(user_id))).all()
+    child = [
+        UserTagStatsResponseChild(
+            tag=stat.tag,
+            attempts=stat.attempts,
+            correct_count=stat.correct_count,
+            accuracy=stat.correct_count / stat.attempts if stat.attempts else 0.0,
+            last_answered_at=stat.last_answered_at,
+        )
+        for stat in stats
+    ]
+    return UserTagStatsResponse(child=child)
+
+
+@router.put("/users/{user_id}", response_model=User)
+async def update_user(
+    user_id: int, user: UserCreate, db: AsyncSession = Depends(get_async_db)
+):
+    db_user = await get_user(db, user_id)
+    db_user.name = user.name
+    db_user.email = user.email
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+@router.delete("/users/{user_id}", status_code=204)
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_user = await get_user(db, user_id)
+    await db.delete(db_user)
+    await db.commit()
+    token_cache.invalidate_user(user_id)
+    return {"message": "User deleted successfully"}
+
+
+@router.post("/login/", response_model=SessionResponse)
+async def login_user(user: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    db_user = await db.scalar(
+        select(models.UserModel).where(models.UserModel.email == user.email)
+    )
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    if db_user.password != user.password:
+        raise HTTPException(status_code=404, detail="Password is incorrect")
+    token = uuid.uuid4().hex
+    db.add(models.UserSessionModel(user_id=db_user.id, token=token))
+    await db.commit()
+    return SessionResponse(token=token)
+
+
+@router.post("/logout/", status_code=204)
+async def logout_user(token: str, db: AsyncSession = Depends(get_async_db)):
+    await db.execute(
+        delete(models.UserSessionModel).where(models.UserSessionModel.token == token)
+    )
+    await db.commit()
+    token_cache.invalidate(token)
+
+
+@router.post("/login/{user_id}/reset_password")
+async def reset_password(
+    user_id: int, new_password: str, db: AsyncSession = Depends(get_async_db)
+):
+    db_user = await get_user(db, user_id)
+    db_user.password = new_password
+    await db.commit()
+    return {"message": "Password reset successfully"}
+
+
+@router.post(
+    "/results/",
+    description="ユーザーの回答を送信する",
+)
+async def post_result(data: UserAnswerCreate, db: AsyncSession = Depends(get_async_db)):
+    user_id = await resolve_user_id_async(db, data.token)
+    await get_user(db, user_id)
+    if data.quize_list_uuid is not None:
+        # POST /quizzes で発行したUUIDに紐づける（同じクイズの二重送信は拒否）
+        try:
+            uuid.UUID(data.quize_list_uuid)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid quize_list_uuid")
+        exists = await db.scalar(
+            select(models.QuizAttemptModel.id).where(
+                models.QuizAttemptModel.quize_list_uuid == data.quize_list_uuid
+            )
+        )
+        if exists is not None:
+            raise HTTPException(status_code=409, detail="Result already posted")
+    try:
+        quize_list_uuid = await crud.insert_user_answers_async(
+            db,
+            user_id,
+            data.child,
+            quize_list_uuid=data.quize_list_uuid,
+            started_at=data.started_at,
+        )
+        await db.commit()
+    except crud.UnknownQuestionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        await db.rollback()
+        # 同じUUIDの送信が同時に来て、上の確認を両方すり抜けた場合だけ409にする
+        if data.quize_list_uuid is not None and await db.scalar(
+            crud.attempt_exists_query(data.quize_list_uuid)
+        ):
+            raise HTTPException(status_code=409, detail="Result already posted")
+        raise
+    return {"quize_list_uuid": quize_list_uuid}
+
+
+@router.get("/user_history_uuid", response_model=UserAnswerResponse)
+async def read_user_answer(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    limit = page_limit(limit, cursor)
+    query = select(models.QuizAttemptModel).where(
+        models.QuizAttemptModel.user_id == user_id
+    )
+    if cursor is not None:
+        last_finished_at, last_id = decode_datetime_id_cursor(cursor)
+        query = query.where(
+            or_(
+                models.QuizAttemptModel.finished_at > last_finished_at,
+                and_(
+                    models.QuizAttemptModel.finished_at == last_finished_at,
+                    models.QuizAttemptModel.id > last_id,
+                ),
+            )
+        )
+    attempts = (
+        await db.scalars(
+            query.order_by(
+                models.QuizAttemptModel.finished_at, models.QuizAttemptModel.id
+            ).limit(fetch_limit(limit))
+        )
+    ).all()
+    next_cursor = None
+    if limit is not None and len(attempts) > limit:
+        attempts = attempts[:limit]
+        next_cursor = encode_cursor(attempts[-1].finished_at, attempts[-1].id)
+
+    child = [
+        UserAnswerResponseChild(
+            quize_list_uuid=attempt.quize_list_uuid,
+            answered_at=attempt.finished_at,
+            started_at=attempt.started_at,
+            question_count=attempt.question_count,
+            correct_count=attempt.correct_count,
+        )
+        for attempt in attempts
+    ]
+    return UserAnswerResponse(child=child, next_cursor=next_cursor)
+
+
+@router.get("/user_history_by_uuid/", response_model=UserAnswerDetailResponse)
+async def read_user_answer_by_uuid(
+    quize_list_uuid: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    limit = page_limit(limit, cursor)
+    query = (
+        select(models.UserAnswerModel, models.QuestionModel)
+        .join(
+            models.QuestionModel,
+            models.UserAnswerModel.question_id == models.QuestionModel.id,
+        )
+        .where(
+            models.UserAnswerModel.user_id == user_id,
+            models.UserAnswerModel.quize_list_uuid == quize_list_uuid,
+        )
+    )
+    if cursor is not None:
+        query = query.where(models.UserAnswerModel.id > decode_id_cursor(cursor))
+    user_answers = (
+        await db.execute(
+            query.order_by(models.UserAnswerModel.id).limit(fetch_limit(limit))
+        )
+    ).all()
+    next_cursor = None
+    if limit is not None and len(user_answers) > limit:
+        user_answers = user_answers[:limit]
+        next_cursor = encode_cursor(user_answers[-1][0].id)
+
+    child = [
+        UserAnswerDetailResponseChild(
+            id=answer.id,
+            user_id=answer.user_id,
+            question_id=answer.question_id,
+            question_text=question.question_text,
+            correct_answer=question.correct_answer,
+            choices=question.choices,
+            commentary=question.commentary,
+            tag=question.tag,
+            is_correct=answer.is_correct,
+        )
+        for answer, question in user_answers
+    ]
+    return UserAnswerDetailResponse(child=child, next_cursor=next_cursor)
+
+
+@router.delete("/user_history_uuid")
+async def delete_user_answer(
+    quize_list_uuid: str,
+    user_id: int = Depends(get_current_user_id_async),
+    db: AsyncSession = Depends(get_async_db),
+):
+    await crud.delete_quiz_answers_async(db, user_id, quize_list_uuid)
+    await db.commit()
@@ -0,0 +1,120 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import get_async_db, get_db
+
+
+class TokenCache:
+    # token -> user_id を保持するサイズ上限付きのLRU/TTLキャッシュ
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 5.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[str, tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[int]:
+        with self._lock:
+            entry = self._data.get(token)
+            if entry is None or entry[1] < time.monotonic():
+                if entry is not None:
+                    del self._data[token]
+                self.misses += 1
+                return None
+            self._data.move_to_end(token)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, token: str, user_id: int) -> None:
+        with self._lock:
+            self._data[token] = (user_id, time.monotonic() + self.ttl)
+            self._data.move_to_end(token)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        with self._lock:
+            self._data.pop(token, None)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            for token in [t for t, (uid, _) in self._data.items() if uid == user_id]:
+                del self._data[token]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# invalidate/invalidate_userは自分のプロセスのキャッシュしか消さないため、
+# ログアウト・ユーザー削除後も他のワーカーでは最大TOKEN_CACHE_TTL秒トークンが通る。
+# 複数ワーカーで動かすことを前提に、既定値は数秒にとどめる
+token_cache = TokenCache(
+    maxsize=int(os.environ.get("TOKEN_CACHE_MAXSIZE", "10000")),
+    ttl=float(os.environ.get("TOKEN_CACHE_TTL", "5")),
+)
+
+
+# トークンからユーザーIDを取得する（キャッシュになければDBを参照）
+def resolve_user_id(db: Session, token: str) -> int:
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    session = (
+        db.query(models.UserSessionModel.user_id)
+        .filter(models.UserSessionModel.token == token)
+        .first()
+    )
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    token_cache.set(token, session.user_id)
+    return session.user_id
+
+
+# クエリパラメータのtokenで認証するエンドポイント用の依存関係
+def get_current_user_id(token: str, db: Session = Depends(get_db)) -> int:
+    return resolve_user_id(db, token)
+
+
+async def resolve_user_id_async(db: AsyncSession, token: str) -> int:
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+    user_id = await db.scalar(
+        select(models.UserSessionModel.user_id).where(
+            models.UserSessionModel.token == token
+        )
+    )
+    if user_id is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    token_cache.set(token, user_id)
+    return user_id
+
+
+async def get_current_user_id_async(
+    token: str, db: AsyncSession = Depends(get_async_db)
+) -> int:
+    return await resolve_user_id_async(db, token)
@@ -0,0 +1,317 @@
+import uuid
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Select,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models
+from app.question_catalog import question_catalog
+from app.schemas import QuestionCreateChild
+
+# 1回のINSERT文にまとめる行数（MySQLのmax_allowed_packetを超えないように分割する）
+RESULTS_INSERT_CHUNK_SIZE = 500
+
+
+class UnknownQuestionError(ValueError):
+    # questionsテーブルにない問題IDへの解答
+    def __init__(self, question_ids: list[int]):
+        super().__init__(f"Unknown question ids: {question_ids}")
+        self.question_ids = question_ids
+
+
+def check_question_ids(child, tags: dict[int, Optional[str]]) -> None:
+    missing = sorted({q.question_id for q in child if q.question_id not in tags})
+    if missing:
+        raise UnknownQuestionError(missing)
+
+
+# 主キーが重複したら更新する複数行INSERT文を作る
+# update には挿入しようとした値の列（MySQLのVALUES() / excluded）を受け取り、SET句を返す関数を渡す
+def build_upsert(
+    dialect: Dialect,
+    model,
+    rows: list[dict],
+    index_elements: list,
+    update: Callable[..., dict],
+) -> Insert:
+    if dialect.name == "mysql":
+        from sqlalchemy.dialects.mysql import insert as dialect_insert
+
+        statement = dialect_insert(model).values(rows)
+        return statement.on_duplicate_key_update(update(statement.inserted))
+    if dialect.name in ("sqlite", "postgresql"):
+        if dialect.name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+
+        statement = dialect_insert(model).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=index_elements, set_=update(statement.excluded)
+        )
+    raise ValueError(f"upsert is not supported for {dialect.name}")
+
+
+def _question_tags_query(question_ids) -> Select:
+    return select(models.QuestionModel.id, models.QuestionModel.tag).where(
+        models.QuestionModel.id.in_(question_ids)
+    )
+
+
+# 問題IDからタグを引く（カタログにない問題だけDBを参照する）
+def _cached_question_tags(question_ids) -> tuple[dict[int, Optional[str]], list[int]]:
+    tags = {}
+    missing = []
+    for question_id in set(question_ids):
+        entry = question_catalog.get(question_id)
+        if entry is not None:
+            tags[question_id] = entry.question.tag
+        else:
+            missing.append(question_id)
+    return tags, missing
+
+
+def question_tags(db: Session, question_ids) -> dict[int, Optional[str]]:
+    tags, missing = _cached_question_tags(question_ids)
+    if missing:
+        tags.update(db.execute(_question_tags_query(missing)).tuples().all())
+    return tags
+
+
+async def question_tags_async(
+    db: AsyncSession, question_ids
+) -> dict[int, Optional[str]]:
+    tags, missing = _cached_question_tags(question_ids)
+    if missing:
+        tags.update((await db.execute(_question_tags_query(missing))).tuples().all())
+    return tags
+
+
+# 解答した問題のタグごとに user_tag_stats へ加算するupsert文を作る
+def build_tag_stats_upsert(
+    dialect: Dialect,
+    user_id: int,
+    rows: list[dict],
+    tags: dict[int, Optional[str]],
+    answered_at: datetime,
+) -> Optional[Insert]:
+    deltas: dict[str, list[int]] = {}
+    for row in rows:
+        tag = tags.get(row["question_id"])
+        if tag is None:
+            continue
+        delta = deltas.setdefault(tag, [0, 0])
+        delta[0] += 1
+        delta[1] += 1 if row["is_correct"] else 0
+    if not deltas:
+        return None
+    stats = models.UserTagStatModel
+    return build_upsert(
+        dialect,
+        stats,
+        [
+            {
+                "user_id": user_id,
+                "tag": tag,
+                "attempts": attempts,
+                "correct_count": correct_count,
+                "last_answered_at": answered_at,
+            }
+            for tag, (attempts, correct_count) in sorted(deltas.items())
+        ],
+        [stats.user_id, stats.tag],
+        lambda new: {
+            "attempts": stats.attempts + new.attempts,
+            "correct_count": stats.correct_count + new.correct_count,
+            "last_answered_at": new.last_answered_at,
+        },
+    )
+
+
+# 1回の解答（クイズ）全体を書き込む複数行INSERT文を作る
+# dialectとtags（問題ID -> タグ）を渡すとuser_tag_statsの更新も含める
+def build_answer_inserts(
+    user_id: int,
+    child: Iterable[QuestionCreateChild],
+    chunk_size: int = RESULTS_INSERT_CHUNK_SIZE,
+    quize_list_uuid: Optional[str] = None,
+    started_at: Optional[datetime] = None,
+    dialect: Optional[Dialect] = None,
+    tags: Optional[dict[int, Optional[str]]] = None,
+) -> tuple[str, list[Insert]]:
+    quize_list_uuid = quize_list_uuid or str(uuid.uuid4())
+    # クイズ全体で同じ解答時刻を使う
+    answered_at = datetime.now()
+    rows = [
+        {
+            "user_id": user_id,
+            "question_id": question.question_id,
+            "is_correct": question.is_correct,
+            "quize_list_uuid": quize_list_uuid,
+            "answered_at": answered_at,
+        }
+        for question in child
+    ]
+    if not rows:
+        return quize_list_uuid, []
+    statements = [
+        insert(models.UserAnswerModel).values(rows[start : start + chunk_size])
+        for start in range(0, len(rows), chunk_size)
+    ]
+    # 履歴一覧用の集計行も同じトランザクションで書き込む
+    statements.append(
+        insert(models.QuizAttemptModel).values(
+            quize_list_uuid=quize_list_uuid,
+            user_id=user_id,
+            started_at=started_at or answered_at,
+            finished_at=answered_at,
+            question_count=len(rows),
+            correct_count=sum(1 for row in rows if row["is_correct"]),
+        )
+    )
+    if dialect is not None and tags is not None:
+        stats_upsert = build_tag_stats_upsert(dialect, user_id, rows, tags, answered_at)
+        if stats_upsert is not None:
+            statements.append(stats_upsert)
+    return quize_list_uuid, statements
+
+
+def insert_user_answers(db: Session, user_id: int, child, **kwargs) -> str:
+    child = list(child)
+    tags = question_tags(db, [question.question_id for question in child])
+    check_question_ids(child, tags)
+    quize_list_uuid, statements = build_answer_inserts(
+        user_id, child, dialect=db.get_bind().dialect, tags=tags, **kwargs
+    )
+    for statement in statements:
+        db.execute(statement)
+    return quize_list_uuid
+
+
+async def insert_user_answers_async(
+    db: AsyncSession, user_id: int, child, **kwargs
+) -> str:
+    child = list(child)
+    tags = await question_tags_async(db, [question.question_id for question in child])
+    check_question_ids(child, tags)
+    quize_list_uuid, statements = build_answer_inserts(
+        user_id, child, dialect=db.bind.dialect, tags=tags, **kwargs
+    )
+    for statement in statements:
+        await db.execute(statement)
+    return quize_list_uuid
+
+
+def attempt_exists_query(quize_list_uuid: str) -> Select:
+    return select(models.QuizAttemptModel.id).where(
+        models.QuizAttemptModel.quize_list_uuid == quize_list_uuid
+    )
+
+
+def tag_stats_query(user_id: int) -> Select:
+    return (
+        select(models.UserTagStatModel)
+        .where(models.UserTagStatModel.user_id == user_id)
+        .order_by(models.UserTagStatModel.tag)
+    )
+
+
+# 1回の解答（クイズ）のタグごとの (タグ, 解答数, 正解数)
+def answer_tag_counts_query(user_id: int, quize_list_uuid: str) -> Select:
+    answers = models.UserAnswerModel
+    return (
+        select(
+            models.QuestionModel.tag,
+            func.count(),
+            func.sum(case((answers.is_correct, 1), else_=0)),
+        )
+        .join(models.QuestionModel, answers.question_id == models.QuestionModel.id)
+        .where(
+            answers.user_id == user_id,
+            answers.quize_list_uuid == quize_list_uuid,
+            models.QuestionModel.tag.is_not(None),
+        )
+        .group_by(models.QuestionModel.tag)
+    )
+
+
+# 削除する解答の分だけuser_tag_statsから差し引く文を作る（最終解答日時はそのまま）
+# 解答数が0になったタグの行は消す
+def _tag_stats_decrements(user_id: int, counts) -> list:
+    stats = models.UserTagStatModel
+    statements = [
+        update(stats)
+        .where(stats.user_id == user_id, stats.tag == tag)
+        .values(
+            attempts=stats.attempts - attempts,
+            correct_count=stats.correct_count - correct_count,
+        )
+        for tag, attempts, correct_count in counts
+    ]
+    if statements:
+        statements.append(
+            delete(stats).where(stats.user_id == user_id, stats.attempts <= 0)
+        )
+    return statements
+
+
+def subtract_tag_stats(db: Session, user_id: int, quize_list_uuid: str) -> None:
+    counts = db.execute(answer_tag_counts_query(user_id, quize_list_uuid)).all()
+    for statement in _tag_stats_decrements(user_id, counts):
+        db.execute(statement)
+
+
+async def subtract_tag_stats_async(
+    db: AsyncSession, user_id: int, quize_list_uuid: str
+) -> None:
+    counts = (await db.execute(answer_tag_counts_query(user_id, quize_list_uuid))).all()
+    for statement in _tag_stats_decrements(user_id, counts):
+        await db.execute(statement)
+
+
+def _attempt_delete(user_id: int, quize_list_uuid: str) -> Delete:
+    return delete(models.QuizAttemptModel).where(
+        models.QuizAttemptModel.user_id == user_id,
+        models.QuizAttemptModel.quize_list_uuid == quize_list_uuid,
+    )
+
+
+def _answers_delete(user_id: int, quize_list_uuid: str) -> Delete:
+    return delete(models.UserAnswerModel).where(
+        models.UserAnswerModel.user_id == user_id,
+        models.UserAnswerModel.quize_list_uuid == quize_list_uuid,
+    )
+
+
+# 1回分の解答を削除する。quiz_attemptsの行を先に消し、消せたリクエストだけが
+# user_tag_statsを差し引く（同じクイズの削除が同時に来ても、後の方は行ロックを
+# 待ってから0件になるので二重に引かない）
+def delete_quiz_answers(db: Session, user_id: int, quize_list_uuid: str) -> bool:
+    deleted = db.execute(_attempt_delete(user_id, quize_list_uuid)).rowcount
+    if deleted:
+        subtract_tag_stats(db, user_id, quize_list_uuid)
+    db.execute(_answers_delete(user_id, quize_list_uuid))
+    return deleted > 0
+
+
+async def delete_quiz_answers_async(
+    db: AsyncSession, user_id: int, quize_list_uuid: str
+) -> bool:
+    deleted = (await db.execute(_attempt_delete(user_id, quize_list_uuid))).rowcount
+    if deleted:
+        await subtract_tag_stats_async(db, user_id, quize_list_uuid)
+    await db.execute(_answers_delete(user_id, quize_list_uuid))
+    return deleted > 0
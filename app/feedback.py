@@ -0,0 +1,260 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import AsyncIterator, List, Optional
+
+from pydantic import BaseModel
+
+from app import metrics
+from app.feedback_cache import FeedbackKey, feedback_cache, make_key
+from app.feedback_templates import template_index
+from app.question_catalog import QUESTION_TAGS
+
+OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434/v1")
+OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "ELYZA")
+# ワーカー全体でOllamaに同時に投げるリクエスト数の上限
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "4"))
+# 1リクエスト内で同時に生成するタグ数の上限
+LLM_REQUEST_CONCURRENCY = int(os.environ.get("LLM_REQUEST_CONCURRENCY", "5"))
+
+SYSTEM_PROMPT = "あなたはAI検定の指導者で、受験者に役立つ日本語のフィードバックを提供します。フィードバックは簡潔で正確にし、不要な英語や冗長な情報は含めないでください。"
+
+# フィードバックを生成するタグ（questions.tag の値）
+FEEDBACK_TAGS = QUESTION_TAGS
+
+_client = None
+_client_lock = threading.Lock()
+
+
+# Ollama APIクライアント（openaiのimportに時間がかかるので、最初に使うときか起動時のwarmupで作る）
+def get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from openai import AsyncOpenAI
+
+                _client = AsyncOpenAI(
+                    base_url=OLLAMA_BASE_URL,
+                    api_key="ollama",  # required, but unused
+                )
+    return _client
+
+
+llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+
+# リクエストデータのモデル定義
+class FeedbackQuestion(BaseModel):
+    tag: str
+    is_correct: Optional[bool]  # None を許容
+    time_taken: float
+
+
+class TagSummary(BaseModel):
+    correct_count: int
+    total_count: int
+    avg_response_time: float
+
+
+# 問題ごとの結果をタグ単位に1回の走査で集計する
+def summarize_questions(data: List[FeedbackQuestion]) -> dict[str, TagSummary]:
+    totals: dict[str, list[float]] = {}
+    for item in data:
+        total = totals.setdefault(item.tag, [0, 0, 0.0])
+        # None を False 扱いにする
+        total[0] += 1 if item.is_correct is True else 0
+        total[1] += 1
+        total[2] += item.time_taken
+    return {
+        tag: TagSummary(
+            correct_count=correct_count,
+            total_count=total_count,
+            avg_response_time=time_taken / total_count,
+        )
+        for tag, (correct_count, total_count, time_taken) in totals.items()
+    }
+
+
+# (タグ, 解答数, 正解数) の集計をフィードバック用の集計に変換する
+# （user_tag_stats・クイズごとのGROUP BYの結果。解答時間は記録していないので0）
+def summarize_tag_counts(counts) -> dict[str, TagSummary]:
+    return {
+        tag: TagSummary(
+            correct_count=correct_count or 0,
+            total_count=attempts,
+            avg_response_time=0.0,
+        )
+        for tag, attempts, correct_count in counts
+        if attempts > 0
+    }
+
+
+def build_prompt(tag: str, summary: TagSummary) -> str:
+    return f"{tag}の正答率は{summary.correct_count}/{summary.total_count}で、平均解答時間は{summary.avg_response_time:.2f}秒です。復習を行い、理解を深めましょう。\n"
+
+
+def build_messages(feedback: str) -> list[dict]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": feedback},
+    ]
+
+
+def cache_key_for(tag: str, summary: TagSummary) -> FeedbackKey:
+    return make_key(
+        OLLAMA_MODEL,
+        tag,
+        summary.correct_count,
+        summary.total_count,
+        summary.avg_response_time,
+    )
+
+
+def lookup_template(tag: str, summary: TagSummary) -> Optional[str]:
+    return template_index.lookup(tag, summary.correct_count, summary.total_count)
+
+
+# LLMが使えないときの応答（テンプレートがなければ集計結果をそのまま返す）
+def fallback_feedback(tag: str, summary: TagSummary) -> str:
+    return lookup_template(tag, summary) or build_prompt(tag, summary).strip()
+
+
+# タグごとにフィードバックを生成する関数
+# rich=Falseならテンプレートを優先し、該当がない場合だけLLMを呼ぶ
+async def generate_feedback_by_tag(
+    tag: str,
+    summary: Optional[TagSummary],
+    rich: bool = False,
+) -> str:
+    if summary is None:
+        return f"{tag}に関連するデータがありません。"
+
+    if not rich:
+        template = lookup_template(tag, summary)
+        if template is not None:
+            return template
+
+    cache_key = cache_key_for(tag, summary)
+    cached = await feedback_cache.aget(cache_key)
+    if cached is not None:
+        return cached
+
+    # フィードバックをOLLAMAに生成させる
+    try:
+        async with llm_semaphore:
+            start = time.perf_counter()
+            response = await get_client().chat.completions.create(
+                model=OLLAMA_MODEL, messages=build_messages(build_prompt(tag, summary))
+            )
+            metrics.llm_request_duration_seconds.observe(
+                time.perf_counter() - start, tag
+            )
+    except Exception as e:
+        metrics.llm_requests_total.inc(tag, "error")
+        logging.warning(f"LLM unavailable for {tag}: {e}")
+        return fallback_feedback(tag, summary)
+    metrics.llm_requests_total.inc(tag, "ok")
+
+    # フィードバックの出力
+    ollama_feedback = response.choices[0].message.content.strip()  # 不要な空白を削除
+    await feedback_cache.aset(cache_key, ollama_feedback)
+    return ollama_feedback
+
+
+# タグごとのフィードバックをトークン単位で返す（stream=True）
+async def stream_feedback_by_tag(
+    tag: str,
+    summary: Optional[TagSummary],
+    rich: bool = False,
+) -> AsyncIterator[str]:
+    if summary is None:
+        yield f"{tag}に関連するデータがありません。"
+        return
+
+    if not rich:
+        template = lookup_template(tag, summary)
+        if template is not None:
+            yield template
+            return
+
+    cache_key = cache_key_for(tag, summary)
+    cached = await feedback_cache.aget(cache_key)
+    if cached is not None:
+        yield cached
+        return
+
+    chunks = []
+    async with llm_semaphore:
+        start = time.perf_counter()
+        try:
+            stream = await get_client().chat.completions.create(
+                model=OLLAMA_MODEL,
+                messages=build_messages(build_prompt(tag, summary)),
+                stream=True,
+            )
+        except Exception as e:
+            metrics.llm_requests_total.inc(tag, "error")
+            logging.warning(f"LLM unavailable for {tag}: {e}")
+            yield fallback_feedback(tag, summary)
+            return
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                chunks.append(delta)
+                yield delta
+        metrics.llm_request_duration_seconds.observe(time.perf_counter() - start, tag)
+    metrics.llm_requests_total.inc(tag, "ok")
+    await feedback_cache.aset(cache_key, "".join(chunks).strip())
+
+
+# 全タグのフィードバックを並行して生成する
+async def generate_all_feedback(
+    summaries: dict[str, TagSummary], rich: bool = False
+) -> dict[str, str]:
+    request_semaphore = asyncio.Semaphore(LLM_REQUEST_CONCURRENCY)
+
+    async def run(tag: str) -> str:
+        async with request_semaphore:
+            return await generate_feedback_by_tag(tag, summaries.get(tag), rich=rich)
+
+    results = await asyncio.gather(*(run(tag) for tag in FEEDBACK_TAGS))
+    return dict(zip(FEEDBACK_TAGS, results))
+
+
+# 全タグのストリームを並行して実行し、(イベント名, タグ, テキスト) を届いた順に返す
+async def stream_all_feedback(
+    summaries: dict[str, TagSummary], rich: bool = False
+) -> AsyncIterator[tuple[str, str, str]]:
+    request_semaphore = asyncio.Semaphore(LLM_REQUEST_CONCURRENCY)
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run(tag: str) -> None:
+        text = []
+        try:
+            async with request_semaphore:
+                async for delta in stream_feedback_by_tag(
+                    tag, summaries.get(tag), rich=rich
+                ):
+                    text.append(delta)
+                    await queue.put(("token", tag, delta))
+            await queue.put(("done", tag, "".join(text).strip()))
+        except Exception as e:
+            await queue.put(("error", tag, str(e)))
+
+    tasks = [asyncio.create_task(run(tag)) for tag in FEEDBACK_TAGS]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            event = await queue.get()
+            if event[0] != "token":
+                remaining -= 1
+            yield event
+    finally:
+        # クライアントが切断した場合は残りの生成を止める
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+# (model, tag, correct_count, total_count, avg_time_bucket)
+FeedbackKey = tuple[str, str, int, int, int]
+
+# 平均解答時間を何秒刻みでまとめるか
+FEEDBACK_CACHE_TIME_BUCKET = float(os.environ.get("FEEDBACK_CACHE_TIME_BUCKET", "5"))
+
+
+def make_key(
+    model: str, tag: str, correct_count: int, total_count: int, avg_response_time: float
+) -> FeedbackKey:
+    bucket = int(avg_response_time // FEEDBACK_CACHE_TIME_BUCKET)
+    return (model, tag, correct_count, total_count, bucket)
+
+
+class FeedbackCache:
+    # 成績プロファイルごとのLLMフィードバックを保持するLRUキャッシュ
+    # pathを指定するとSQLiteのディスク層も使い、再起動後も結果を再利用する
+
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.path = path
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[FeedbackKey, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        # SQLiteの接続はスレッド間で共有するので、メモリ層とは別のロックで守る
+        self._disk_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ディスク層は最初に使うとき（または起動時のwarmup）に開く
+    def open(self) -> None:
+        with self._disk_lock:
+            self._disk()
+
+    def _disk(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.path:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS feedback_cache"
+                " (key TEXT PRIMARY KEY, feedback TEXT NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _memory_get(self, key: FeedbackKey) -> Optional[str]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+                self.memory_hits += 1
+            return value
+
+    def _disk_get(self, key: FeedbackKey) -> Optional[str]:
+        row = None
+        with self._disk_lock:
+            conn = self._disk()
+            if conn is not None:
+                row = conn.execute(
+                    "SELECT feedback FROM feedback_cache WHERE key = ?",
+                    (json.dumps(key, ensure_ascii=False),),
+                ).fetchone()
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self._store(key, row[0])
+            self.disk_hits += 1
+            return row[0]
+
+    def _disk_set(self, key: FeedbackKey, value: str) -> None:
+        with self._disk_lock:
+            conn = self._disk()
+            if conn is not None:
+                conn.execute(
+                    "INSERT OR REPLACE INTO feedback_cache (key, feedback) VALUES (?, ?)",
+                    (json.dumps(key, ensure_ascii=False), value),
+                )
+                conn.commit()
+
+    def get(self, key: FeedbackKey) -> Optional[str]:
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+        return self._disk_get(key)
+
+    def set(self, key: FeedbackKey, value: str) -> None:
+        with self._lock:
+            self._store(key, value)
+        self._disk_set(key, value)
+
+    # イベントループから呼ぶ版。ディスク層のSELECT・INSERT（commit）は別スレッドで行う
+    async def aget(self, key: FeedbackKey) -> Optional[str]:
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+        if not self.path:
+            return self._disk_get(key)
+        return await asyncio.to_thread(self._disk_get, key)
+
+    async def aset(self, key: FeedbackKey, value: str) -> None:
+        with self._lock:
+            self._store(key, value)
+        if self.path:
+            await asyncio.to_thread(self._disk_set, key, value)
+
+    def _store(self, key: FeedbackKey, value: str) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+        with self._disk_lock:
+            conn = self._disk()
+            if conn is not None:
+                conn.execute("DELETE FROM feedback_cache")
+                conn.commit()
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            total = hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "disk": self.path,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / total if total else 0.0,
+            }
+
+
+feedback_cache = FeedbackCache(
+    maxsize=int(os.environ.get("FEEDBACK_CACHE_MAXSIZE", "1024")),
+    path=os.environ.get("FEEDBACK_CACHE_PATH") or None,
+)
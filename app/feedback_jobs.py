@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func, select, update
+
+from app import metrics, models
+from app.database import SessionLocal
+from app.feedback import TagSummary, generate_all_feedback
+
+# 同時に実行するジョブ数（1ジョブで最大5タグ分のLLM呼び出しを行う）
+FEEDBACK_JOB_WORKERS = int(os.environ.get("FEEDBACK_JOB_WORKERS", "2"))
+# 待ち行列の上限。超えたら新しいジョブを受け付けない
+FEEDBACK_JOB_QUEUE_MAX = int(os.environ.get("FEEDBACK_JOB_QUEUE_MAX", "100"))
+# ロングポーリングで待てる最大秒数
+FEEDBACK_JOB_WAIT_MAX = float(os.environ.get("FEEDBACK_JOB_WAIT_MAX", "30"))
+# 別プロセスのジョブを待つときにDBを見直す間隔
+FEEDBACK_JOB_POLL_INTERVAL = 0.5
+# 受け付けてからこの秒数たっても終わらないジョブは、実行していたワーカーが
+# 落ちたものとみなしてfailedにする（1ジョブの最長実行時間より長くする）
+FEEDBACK_JOB_STALE_SECONDS = float(os.environ.get("FEEDBACK_JOB_STALE_SECONDS", "600"))
+
+FINISHED_STATES = ("done", "failed")
+PENDING_STATES = ("queued", "running")
+
+logger = logging.getLogger("app.feedback_jobs")
+
+
+class QueueFull(Exception):
+    pass
+
+
+def _create_job(job_id: str, user_id: Optional[int], quize_list_uuid) -> None:
+    with SessionLocal() as db:
+        db.add(
+            models.FeedbackResultModel(
+                id=job_id,
+                user_id=user_id,
+                quize_list_uuid=quize_list_uuid,
+                status="queued",
+                created_at=datetime.now(),
+            )
+        )
+        db.commit()
+
+
+def _delete_job(job_id: str) -> None:
+    with SessionLocal() as db:
+        db.query(models.FeedbackResultModel).filter(
+            models.FeedbackResultModel.id == job_id
+        ).delete()
+        db.commit()
+
+
+def _update_job(job_id: str, **values) -> None:
+    with SessionLocal() as db:
+        db.execute(
+            update(models.FeedbackResultModel)
+            .where(models.FeedbackResultModel.id == job_id)
+            .values(**values)
+        )
+        db.commit()
+
+
+# 終わっていないジョブをfailedにする（job_idsかolder_thanで対象を絞る）
+def _fail_pending_jobs(
+    error: str,
+    job_ids: Optional[list[str]] = None,
+    older_than: Optional[datetime] = None,
+) -> int:
+    query = update(models.FeedbackResultModel).where(
+        models.FeedbackResultModel.status.in_(PENDING_STATES)
+    )
+    if job_ids is not None:
+        query = query.where(models.FeedbackResultModel.id.in_(job_ids))
+    if older_than is not None:
+        query = query.where(models.FeedbackResultModel.created_at < older_than)
+    with SessionLocal() as db:
+        result = db.execute(
+            query.values(status="failed", error=error, finished_at=datetime.now())
+        )
+        db.commit()
+        return result.rowcount
+
+
+# 実行していたワーカーがいなくなって残ったジョブを片付ける
+def fail_stale_jobs() -> int:
+    return _fail_pending_jobs(
+        "job was abandoned by its worker",
+        older_than=datetime.now() - timedelta(seconds=FEEDBACK_JOB_STALE_SECONDS),
+    )
+
+
+def get_job(job_id: str) -> Optional[models.FeedbackResultModel]:
+    with SessionLocal() as db:
+        return db.get(models.FeedbackResultModel, job_id)
+
+
+# 全プロセス分のジョブ数を状態ごとに数える（古い未完了ジョブは先に片付ける）
+def count_jobs_by_status() -> dict[str, int]:
+    fail_stale_jobs()
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(models.FeedbackResultModel.status, func.count()).group_by(
+                models.FeedbackResultModel.status
+            )
+        ).all()
+    return dict(rows)
+
+
+class FeedbackJobQueue:
+    # フィードバック生成をHTTPリクエストから切り離して実行するプロセス内のジョブキュー
+    # 状態と結果はfeedback_resultsテーブルに書くので、どのワーカープロセスからでも取得できる
+
+    def __init__(self, workers: int = 2, maxsize: int = 100):
+        self.workers = workers
+        self.maxsize = maxsize
+        self.submitted = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: list[asyncio.Task] = []
+        # ジョブID -> 完了通知（このプロセスで実行中のジョブのみ）
+        self._events: dict[str, asyncio.Event] = {}
+        self._lock = threading.Lock()
+
+    async def start(self) -> None:
+        stale = await asyncio.to_thread(fail_stale_jobs)
+        if stale:
+            logger.warning(f"marked {stale} abandoned feedback jobs as failed")
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    # キューはプロセスのメモリにしかないので、残っているジョブはfailedにしてから止める
+    async def stop(self) -> None:
+        outstanding = list(self._events)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if outstanding:
+            await asyncio.to_thread(
+                _fail_pending_jobs, "worker shut down", job_ids=outstanding
+            )
+        for event in self._events.values():
+            event.set()
+        self._events.clear()
+
+    async def submit(
+        self,
+        summaries: dict[str, TagSummary],
+        rich: bool = False,
+        user_id: Optional[int] = None,
+        quize_list_uuid: Optional[str] = None,
+    ) -> str:
+        if self._queue is None or self._queue.full():
+            raise QueueFull()
+        job_id = uuid.uuid4().hex
+        await asyncio.to_thread(_create_job, job_id, user_id, quize_list_uuid)
+        try:
+            self._queue.put_nowait((job_id, summaries, rich, time.perf_counter()))
+        except asyncio.QueueFull:
+            await asyncio.to_thread(_delete_job, job_id)
+            raise QueueFull()
+        self._events[job_id] = asyncio.Event()
+        with self._lock:
+            self.submitted += 1
+        return job_id
+
+    async def _worker(self) -> None:
+        while True:
+            job_id, summaries, rich, queued_at = await self._queue.get()
+            start = time.perf_counter()
+            metrics.feedback_job_wait_seconds.observe(start - queued_at)
+            with self._lock:
+                self.running += 1
+            try:
+                await asyncio.to_thread(
+                    _update_job, job_id, status="running", started_at=datetime.now()
+                )
+                feedback = await generate_all_feedback(summaries, rich=rich)
+                await asyncio.to_thread(
+                    _update_job,
+                    job_id,
+                    status="done",
+                    feedback=feedback,
+                    finished_at=datetime.now(),
+                )
+                outcome = "done"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"feedback job {job_id} failed")
+                outcome = "failed"
+                try:
+                    await asyncio.to_thread(
+                        _update_job,
+                        job_id,
+                        status="failed",
+                        error=str(e),
+                        finished_at=datetime.now(),
+                    )
+                except Exception:
+                    logger.exception(f"could not record failure of job {job_id}")
+            finally:
+                with self._lock:
+                    self.running -= 1
+                self._queue.task_done()
+                event = self._events.pop(job_id, None)
+                if event is not None:
+                    event.set()
+            metrics.feedback_job_run_seconds.observe(time.perf_counter() - start)
+            metrics.feedback_jobs_total.inc(outcome)
+            with self._lock:
+                if outcome == "done":
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    # ジョブが終わるかtimeout秒たつまで待ち、最新の状態を返す（ロングポーリング用）
+    async def wait(
+        self, job_id: str, timeout: float
+    ) -> Optional[models.FeedbackResultModel]:
+        deadline = time.monotonic() + min(timeout, FEEDBACK_JOB_WAIT_MAX)
+        while True:
+            job = await asyncio.to_thread(get_job, job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job.status in FINISHED_STATES or remaining <= 0:
+                return job
+            event = self._events.get(job_id)
+            if event is None and job.created_at < datetime.now() - timedelta(
+                seconds=FEEDBACK_JOB_STALE_SECONDS
+            ):
+                # 別プロセスのジョブが終わらないまま古くなっていれば打ち切る
+                await asyncio.to_thread(fail_stale_jobs)
+                return await asyncio.to_thread(get_job, job_id)
+            if event is not None:
+                # このプロセスで実行中なら完了通知を待つ
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await asyncio.sleep(min(FEEDBACK_JOB_POLL_INTERVAL, remaining))
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self._queue.qsize() if self._queue else 0,
+                "queue_max": self.maxsize,
+                "running": self.running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+
+feedback_job_queue = FeedbackJobQueue(
+    workers=FEEDBACK_JOB_WORKERS, maxsize=FEEDBACK_JOB_QUEUE_MAX
+)
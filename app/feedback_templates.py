@@ -0,0 +1,55 @@
+import threading
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from app import models
+
+
+class TemplateIndex:
+    # feedback_templatesをタグごとにメモリへ展開した索引
+    # テンプレート文中の {tag} {correct_count} {total_count} {rate} は埋め込まれる
+
+    def __init__(self):
+        self._by_tag: dict[Optional[str], list[tuple[int, int, str]]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> int:
+        by_tag: dict[Optional[str], list[tuple[int, int, str]]] = {}
+        templates = db.query(models.FeedbackTemplateModel).all()
+        for template in templates:
+            min_rate = template.min_rate if template.min_rate is not None else 0
+            max_rate = template.max_rate if template.max_rate is not None else 100
+            by_tag.setdefault(template.tag, []).append(
+                (min_rate, max_rate, template.feedback)
+            )
+        # 範囲の狭い（より具体的な）テンプレートを優先する
+        for entries in by_tag.values():
+            entries.sort(key=lambda entry: entry[1] - entry[0])
+        with self._lock:
+            self._by_tag = by_tag
+        return len(templates)
+
+    def lookup(self, tag: str, correct_count: int, total_count: int) -> Optional[str]:
+        rate = correct_count * 100 // total_count if total_count else 0
+        by_tag = self._by_tag
+        # タグ専用のテンプレートがなければタグ未指定（共通）のものを使う
+        for key in (tag, None):
+            for min_rate, max_rate, feedback in by_tag.get(key, ()):
+                if min_rate <= rate <= max_rate:
+                    try:
+                        return feedback.format(
+                            tag=tag,
+                            correct_count=correct_count,
+                            total_count=total_count,
+                            rate=rate,
+                        )
+                    except (KeyError, IndexError, ValueError):
+                        return feedback
+        return None
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_tag.values())
+
+
+template_index = TemplateIndex()
@@ -0,0 +1,147 @@
+"""問題データ（JSON / JSONL / CSV）をquestionsテーブルに一括登録するCLI。
+
+    python -m app.load_questions                      # app/data/questions.json を登録
+    python -m app.load_questions extra.csv --database-url sqlite:///./dev.db --create-tables
+    python -m app.load_questions questions.jsonl --dry-run
+
+各行を schemas.Question で検証し、idが同じ問題は上書きする（upsert）。
+全件を1トランザクションで、複数行INSERTにまとめて書き込む。
+CSVの choices 列はJSON配列か "|" 区切りの文字列で書く。
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from typing import Iterable
+
+from pydantic import ValidationError
+from sqlalchemy import Insert
+from sqlalchemy.engine import Dialect
+
+from app import crud, models
+from app.database import create_db_engine
+from app.schemas import Question
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "data", "questions.json")
+
+# 1回のINSERT文にまとめる行数（MySQLのmax_allowed_packetを超えないように分割する）
+QUESTION_INSERT_CHUNK_SIZE = 500
+
+UPDATE_COLUMNS = ("question_text", "correct_answer", "choices", "commentary", "tag")
+
+
+class QuestionFileError(Exception):
+    pass
+
+
+def read_rows(path: str) -> Iterable[tuple[int, dict]]:
+    # (行番号, 生の辞書) を返す。JSONは配列の何番目かを行番号とする
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8", newline="") as f:
+        if ext == ".json":
+            data = json.load(f)
+            if not isinstance(data, list):
+                raise QuestionFileError(f"{path}: top level must be a JSON array")
+            yield from enumerate(data, start=1)
+        elif ext == ".jsonl":
+            for line_no, line in enumerate(f, start=1):
+                if line.strip():
+                    yield line_no, json.loads(line)
+        elif ext == ".csv":
+            # 1行目はヘッダーなのでデータは2行目から
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                choices = row.get("choices") or ""
+                if choices.lstrip().startswith("["):
+                    row["choices"] = json.loads(choices)
+                else:
+                    row["choices"] = [c.strip() for c in choices.split("|") if c]
+                row["tag"] = row.get("tag") or None
+                yield line_no, row
+        else:
+            raise QuestionFileError(f"{path}: unsupported file type {ext!r}")
+
+
+def load_questions(path: str) -> list[Question]:
+    questions = {}
+    errors = []
+    for line_no, row in read_rows(path):
+        try:
+            question = Question.model_validate(row)
+        except ValidationError as e:
+            errors.append(f"{path}:{line_no}: {e}")
+            continue
+        # 同じidが複数回出てきたら後の行を使う
+        questions[question.id] = question
+    if errors:
+        raise QuestionFileError("\n".join(errors))
+    return list(questions.values())
+
+
+def build_question_upsert(dialect: Dialect, rows: list[dict]) -> Insert:
+    return crud.build_upsert(
+        dialect,
+        models.QuestionModel,
+        rows,
+        [models.QuestionModel.id],
+        lambda new: {column: new[column] for column in UPDATE_COLUMNS},
+    )
+
+
+def upsert_questions(
+    connection, questions: list[Question], chunk_size=QUESTION_INSERT_CHUNK_SIZE
+) -> None:
+    rows = [question.model_dump() for question in questions]
+    for start in range(0, len(rows), chunk_size):
+        connection.execute(
+            build_question_upsert(connection.dialect, rows[start : start + chunk_size])
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--chunk-size", type=int, default=QUESTION_INSERT_CHUNK_SIZE)
+    parser.add_argument(
+        "--create-tables",
+        action="store_true",
+        help="create missing tables first (normally done by alembic upgrade head)",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="validate the file without writing"
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        questions = load_questions(args.path)
+    except (OSError, ValueError, QuestionFileError) as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    parsed = time.perf_counter()
+    print(f"validated {len(questions)} questions in {parsed - start:.3f}s")
+    if args.dry_run:
+        return
+
+    if args.database_url:
+        engine = create_db_engine(args.database_url)
+    else:
+        from app.database import engine
+    if args.create_tables:
+        models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        upsert_questions(connection, questions, args.chunk_size)
+    done = time.perf_counter()
+    print(
+        f"upserted {len(questions)} questions in {done - parsed:.3f}s "
+        f"(total {done - start:.3f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
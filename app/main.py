@@ -1,18 +1,75 @@
+import time
+
+# importにかかった時間を起動時間の内訳に含める
+_import_started = time.perf_counter()
+
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from typing import List
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta, timezone
 from typing import Optional
+from contextlib import asynccontextmanager
+import asyncio
+import json
+import os
+import random
 import uuid
-from fastapi import Cookie, FastAPI, HTTPException, Depends, Response
+from fastapi import APIRouter, Cookie, FastAPI, HTTPException, Depends, Response
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import Any, Generator, List
-from app import models
-from app.database import SessionLocal, engine
+from app import async_routes, crud, metrics, models, slow_query, startup
+from app.auth import get_current_user_id, resolve_user_id, token_cache
+from app.feedback import (
+    FeedbackQuestion,
+    TagSummary,
+    generate_all_feedback,
+    stream_all_feedback,
+    summarize_questions,
+    summarize_tag_counts,
+)
+from app.feedback_cache import feedback_cache
+from app.feedback_jobs import (
+    QueueFull,
+    count_jobs_by_status,
+    feedback_job_queue,
+    get_job,
+)
+from app.feedback_templates import template_index
+from app.pagination import (
+    check_limit,
+    decode_datetime_id_cursor,
+    decode_id_cursor,
+    encode_cursor,
+    fetch_limit,
+    page_limit,
+)
+from app.question_catalog import (
+    QUESTION_CACHE_MAX_AGE,
+    QUESTION_CATALOG_CHECK_SECONDS,
+    QUESTION_TAGS,
+    etag_matches,
+    question_catalog,
+)
+from app.database import (
+    USE_ASYNC_DB,
+    SessionLocal,
+    async_engine,
+    engine,
+    get_db,
+)
+from app.db_pool import pool_status
 from fastapi.middleware.cors import CORSMiddleware
 from app.schemas import (
+    QUIZ_MAX_COUNT,
+    FeedbackJobResponse,
     Question,
+    QuestionBatchRequest,
+    QuestionBatchResponse,
+    QuizCreate,
+    QuizResponse,
     SessionResponse,
     User,
     UserAnswer,
@@ -23,15 +80,39 @@ from app.schemas import (
     UserAnswerResponseChild,
     UserCreate,
     UserLogin,
+    UserTagStatsResponse,
+    UserTagStatsResponseChild,
 )
 import logging
-from openai import OpenAI
 import traceback
 
-logging.basicConfig()
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+# LOG_LEVELでログの出力レベルを切り替える
+# SQL_ECHO=1のときだけ全SQLを出力する（本番では遅いSQLのみslow_queryに出す）
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper())
+if os.environ.get("SQL_ECHO", "0").lower() in ("1", "true", "yes"):
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+
+slow_query.install(engine)
+if async_engine is not None:
+    slow_query.install(async_engine.sync_engine)
 
-app = FastAPI()  # FastAPIインスタンスを作成
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # スキーマ確認・接続・問題カタログ・テンプレート・LLMクライアントの準備（app.startup）
+    startup.startup_timings.record("import", _import_finished - _import_started)
+    await startup.warmup()
+    await feedback_job_queue.start()
+    catalog_watcher = None
+    if QUESTION_CATALOG_CHECK_SECONDS > 0:
+        catalog_watcher = asyncio.create_task(startup.watch_question_catalog())
+    yield
+    if catalog_watcher is not None:
+        catalog_watcher.cancel()
+    await feedback_job_queue.stop()
+
+
+app = FastAPI(lifespan=lifespan)  # FastAPIインスタンスを作成
 
 
 origins = [
@@ -39,29 +120,59 @@ origins = [
     "http://localhost:8000",
 ]
 
+
+# ルートごとのリクエスト数・ステータス・レイテンシ・SQL件数を記録する
+# （遅いSQLのログにもエンドポイントを残す）
+@app.middleware("http")
+async def instrument_request(request: Request, call_next):
+    endpoint_token = slow_query.current_endpoint.set(
+        f"{request.method} {request.url.path}"
+    )
+    db_stats = metrics.RequestDBStats()
+    db_stats_token = metrics.request_db_stats.set(db_stats)
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        slow_query.current_endpoint.reset(endpoint_token)
+        metrics.request_db_stats.reset(db_stats_token)
+        route = request.scope.get("route")
+        route_path = route.path if route is not None else "unmatched"
+        metrics.http_requests_total.inc(request.method, route_path, str(status))
+        metrics.http_request_duration_seconds.observe(
+            elapsed, request.method, route_path
+        )
+        metrics.db_queries_per_request.observe(
+            db_stats.queries, request.method, route_path
+        )
+        if db_stats.queries:
+            metrics.db_queries_total.inc(
+                request.method, route_path, amount=db_stats.queries
+            )
+            metrics.db_query_seconds_total.inc(
+                request.method, route_path, amount=db_stats.seconds
+            )
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor"],
 )
 
 
-# データベースのテーブルを作成
-models.Base.metadata.create_all(bind=engine)
-
-
-# データベースのセッションを取得
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# DBを使うユーザー・履歴系のルート（USE_ASYNC_DBのときはasync_routesの同名ルートを使う）
+router = APIRouter()
 
 
-@app.post("/users/", response_model=User)
+@router.post("/users/", response_model=User)
 def create_user(user: UserCreate, db: Session = Depends(get_db)):
     db_user = (
         db.query(models.UserModel).filter(models.UserModel.email == user.email).first()
@@ -77,7 +188,7 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     return new_user
 
 
-@app.get("/users/{user_id}", response_model=User)
+@router.get("/users/{user_id}", response_model=User)
 def read_user(user_id: int, db: Session = Depends(get_db)):
     db_user = db.query(models.UserModel).filter(models.UserModel.id == user_id).first()
     if db_user is None:
@@ -85,13 +196,48 @@ def read_user(user_id: int, db: Session = Depends(get_db)):
     return db_user
 
 
-@app.get("/users/", response_model=List[User])
-def read_users(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    users = db.query(models.UserModel).offset(skip).limit(limit).all()
+# 次ページのカーソルはX-Next-Cursorヘッダーで返す（skipは互換のために残す）
+@router.get("/users/", response_model=List[User])
+def read_users(
+    response: Response,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    check_limit(limit)
+    query = db.query(models.UserModel).order_by(models.UserModel.id)
+    if cursor is not None:
+        query = query.filter(models.UserModel.id > decode_id_cursor(cursor))
+    elif skip:
+        query = query.offset(skip)
+    users = query.limit(limit + 1).all()
+    if len(users) > limit:
+        users = users[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(users[-1].id)
     return users
 
 
-@app.put("/users/{user_id}", response_model=User)
+# タグごとの累計成績（user_tag_statsをそのまま返す）
+@router.get("/users/me/stats", response_model=UserTagStatsResponse)
+def read_user_tag_stats(
+    user_id: int = Depends(get_current_user_id), db: Session = Depends(get_db)
+):
+    stats = db.scalars(crud.tag_stats_query(user_id)).all()
+    child = [
+        UserTagStatsResponseChild(
+            tag=stat.tag,
+            attempts=stat.attempts,
+            correct_count=stat.correct_count,
+            accuracy=stat.correct_count / stat.attempts if stat.attempts else 0.0,
+            last_answered_at=stat.last_answered_at,
+        )
+        for stat in stats
+    ]
+    return UserTagStatsResponse(child=child)
+
+
+@router.put("/users/{user_id}", response_model=User)
 def update_user(user_id: int, user: UserCreate, db: Session = Depends(get_db)):
     db_user = db.query(models.UserModel).filter(models.UserModel.id == user_id).first()
     if db_user is None:
@@ -103,18 +249,19 @@ def update_user(user_id: int, user: UserCreate, db: Session = Depends(get_db)):
     return db_user
 
 
-@app.delete("/users/{user_id}", status_code=204)
+@router.delete("/users/{user_id}", status_code=204)
 def delete_user(user_id: int, db: Session = Depends(get_db)):
     db_user = db.query(models.UserModel).filter(models.UserModel.id == user_id).first()
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     db.delete(db_user)
     db.commit()
+    token_cache.invalidate_user(user_id)
     return {"message": "User deleted successfully"}
 
 
 # レスポンスモデルはreturnモデルと同じものを使う
-@app.post("/login/", response_model=SessionResponse)
+@router.post("/login/", response_model=SessionResponse)
 def login_user(user: UserLogin, db: Session = Depends(get_db)):
     db_user = (
         db.query(models.UserModel).filter(models.UserModel.email == user.email).first()
@@ -131,7 +278,95 @@ def login_user(user: UserLogin, db: Session = Depends(get_db)):
     return SessionResponse(token=token)
 
 
-@app.post("/login/{user_id}/reset_password")
+@router.post("/logout/", status_code=204)
+def logout_user(token: str, db: Session = Depends(get_db)):
+    db.query(models.UserSessionModel).filter(
+        models.UserSessionModel.token == token
+    ).delete()
+    db.commit()
+    token_cache.invalidate(token)
+
+
+@app.get("/token_cache/stats")
+def read_token_cache_stats():
+    return token_cache.stats()
+
+
+@app.get("/feedback_cache/stats")
+def read_feedback_cache_stats():
+    return feedback_cache.stats()
+
+
+# Prometheus形式のメトリクス（キャッシュ・コネクションプールの状態も含む）
+@app.get("/metrics", response_class=PlainTextResponse)
+def read_metrics():
+    token_stats = token_cache.stats()
+    feedback_stats = feedback_cache.stats()
+    extra = metrics.render_gauges(
+        "cache_hits",
+        "Cache hits.",
+        {
+            ("token",): token_stats["hits"],
+            ("feedback",): feedback_stats["memory_hits"] + feedback_stats["disk_hits"],
+        },
+        labels=("cache",),
+    )
+    extra += metrics.render_gauges(
+        "cache_misses",
+        "Cache misses.",
+        {("token",): token_stats["misses"], ("feedback",): feedback_stats["misses"]},
+        labels=("cache",),
+    )
+    pools = {"sync": pool_status(engine.pool)}
+    if async_engine is not None:
+        pools["async"] = pool_status(async_engine.sync_engine.pool)
+    for key in ("size", "checked_out", "overflow", "timeouts", "wait_seconds_total"):
+        extra += metrics.render_gauges(
+            f"db_pool_{key}",
+            f"Connection pool {key}.",
+            {(name,): status.get(key, 0) for name, status in pools.items()},
+            labels=("pool",),
+        )
+    extra += metrics.render_gauges(
+        "app_startup_seconds",
+        "Worker startup time by phase.",
+        {
+            (phase,): seconds
+            for phase, seconds in startup.startup_timings.phases.items()
+        },
+        labels=("phase",),
+    )
+    job_stats = feedback_job_queue.stats()
+    extra += metrics.render_gauges(
+        "feedback_jobs",
+        "Feedback jobs in this worker by state.",
+        {("queued",): job_stats["queue_depth"], ("running",): job_stats["running"]},
+        labels=("state",),
+    )
+    return PlainTextResponse(
+        metrics.render(extra), media_type="text/plain; version=0.0.4"
+    )
+
+
+@app.get("/startup/stats")
+def read_startup_stats():
+    return startup.startup_timings.as_dict()
+
+
+@app.get("/db_pool/stats")
+def read_db_pool_stats():
+    stats = {"sync": pool_status(engine.pool)}
+    if async_engine is not None:
+        stats["async"] = pool_status(async_engine.sync_engine.pool)
+    return stats
+
+
+@app.post("/feedback_templates/reload")
+def reload_feedback_templates(db: Session = Depends(get_db)):
+    return {"templates": template_index.load(db)}
+
+
+@router.post("/login/{user_id}/reset_password")
 def reset_password(user_id: int, new_password: str, db: Session = Depends(get_db)):
     db_user = db.query(models.UserModel).filter(models.UserModel.id == user_id).first()
     if db_user is None:
@@ -142,107 +377,221 @@ def reset_password(user_id: int, new_password: str, db: Session = Depends(get_db
     return {"message": "Password reset successfully"}
 
 
-@app.get("/questions/{question_id}", response_model=Question)
-def read_questions(question_id: int, db: Session = Depends(get_db)):
-    questions = (
-        db.query(models.QuestionModel)
-        .filter(models.QuestionModel.id == question_id)
-        .first()
+# 1リクエストで取得できる問題数の上限
+QUESTION_BATCH_MAX = 1000
+
+
+def question_batch_response(question_ids: list[int]) -> Response:
+    if len(question_ids) > QUESTION_BATCH_MAX:
+        raise HTTPException(status_code=400, detail="Too many question ids")
+    return Response(
+        content=question_catalog.batch_body(question_ids),
+        media_type="application/json",
+    )
+
+
+# 複数の問題を指定順にまとめて返す（?ids=1,2,3）
+@app.get("/questions", response_model=QuestionBatchResponse)
+def read_questions_batch(ids: str):
+    try:
+        question_ids = [int(i) for i in ids.split(",") if i.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid question ids")
+    return question_batch_response(question_ids)
+
+
+# IDが多い場合はPOSTのボディで指定する
+@app.post("/questions", response_model=QuestionBatchResponse)
+def read_questions_batch_post(data: QuestionBatchRequest):
+    return question_batch_response(data.ids)
+
+
+# タグごとの出題数に従って問題を抽出し、解答送信用のquize_list_uuidと一緒に返す
+@app.post("/quizzes", response_model=QuizResponse)
+def create_quiz(data: QuizCreate):
+    if data.quotas is None:
+        # 出題数を全タグに均等配分する（余りは先頭のタグから1問ずつ）
+        base, remainder = divmod(data.count, len(QUESTION_TAGS))
+        quotas = {
+            tag: base + (1 if i < remainder else 0)
+            for i, tag in enumerate(QUESTION_TAGS)
+        }
+    else:
+        unknown = [tag for tag in data.quotas if tag not in QUESTION_TAGS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown tags: {unknown}")
+        if any(count < 0 for count in data.quotas.values()):
+            raise HTTPException(status_code=400, detail="Invalid quotas")
+        if sum(data.quotas.values()) > QUIZ_MAX_COUNT:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Total quotas must be at most {QUIZ_MAX_COUNT}",
+            )
+        quotas = data.quotas
+    # 黙って短いクイズを返さず、足りないタグと問題数を返す
+    shortfall = question_catalog.shortfall(quotas)
+    if shortfall:
+        raise HTTPException(
+            status_code=400, detail=f"Not enough questions: {shortfall}"
+        )
+    rng = random.Random(data.seed)
+    question_ids = question_catalog.sample(quotas, rng)
+    rng.shuffle(question_ids)
+    quize_list_uuid = str(uuid.uuid4())
+    return Response(
+        content=question_catalog.quiz_body(quize_list_uuid, question_ids),
+        media_type="application/json",
     )
-    return questions
 
 
-@app.post(
+# 問題はメモリ上のカタログから事前シリアライズ済みのJSONを返す
+@app.get("/questions/{question_id}", response_model=Question)
+def read_questions(question_id: int, request: Request):
+    entry = question_catalog.get(question_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Question not found")
+    headers = {
+        "ETag": entry.etag,
+        "Cache-Control": f"public, max-age={QUESTION_CACHE_MAX_AGE}",
+    }
+    if etag_matches(request.headers.get("if-none-match", ""), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+# 受けたワーカーだけすぐに読み直す（他のワーカーは指紋の定期確認で追従する）
+@app.post("/questions/reload")
+def reload_questions(db: Session = Depends(get_db)):
+    count = question_catalog.load(db)
+    return {"questions": count, "version": question_catalog.version}
+
+
+@router.post(
     "/results/",
     description="ユーザーの回答を送信する",
 )
 def post_result(data: UserAnswerCreate, db: Session = Depends(get_db)):
-    db_session = db.query(models.UserSessionModel).filter(
-        models.UserSessionModel.token == data.token
-    )
-    session = db_session.first()
-    if session is None:
-        raise HTTPException(status_code=404, detail="Session not found")
+    user_id = resolve_user_id(db, data.token)
 
-    db_user = (
-        db.query(models.UserModel)
-        .filter(models.UserModel.id == session.user_id)
-        .first()
-    )
+    db_user = db.query(models.UserModel).filter(models.UserModel.id == user_id).first()
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    quize_list_uuid = str(uuid.uuid4())
-    for question in data.child:
-        new_question = models.UserAnswerModel(
-            user_id=session.user_id,
-            question_id=question.question_id,
-            is_correct=question.is_correct,
-            quize_list_uuid=quize_list_uuid,
-            answered_at=datetime.now(),
+    if data.quize_list_uuid is not None:
+        # POST /quizzes で発行したUUIDに紐づける（同じクイズの二重送信は拒否）
+        try:
+            uuid.UUID(data.quize_list_uuid)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid quize_list_uuid")
+        exists = (
+            db.query(models.QuizAttemptModel.id)
+            .filter(models.QuizAttemptModel.quize_list_uuid == data.quize_list_uuid)
+            .first()
         )
-        db.add(new_question)
-        db.flush()
-    db.commit()
-    db.refresh(new_question)
+        if exists is not None:
+            raise HTTPException(status_code=409, detail="Result already posted")
+    try:
+        quize_list_uuid = crud.insert_user_answers(
+            db,
+            user_id,
+            data.child,
+            quize_list_uuid=data.quize_list_uuid,
+            started_at=data.started_at,
+        )
+        db.commit()
+    except crud.UnknownQuestionError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        db.rollback()
+        # 同じUUIDの送信が同時に来て、上の確認を両方すり抜けた場合だけ409にする
+        if data.quize_list_uuid is not None and db.scalar(
+            crud.attempt_exists_query(data.quize_list_uuid)
+        ):
+            raise HTTPException(status_code=409, detail="Result already posted")
+        raise
+    return {"quize_list_uuid": quize_list_uuid}
 
 
 # --日付の表示だけのと詳細表示（問題一問一問の表示）のページでAPIを分ける-- #
 
 
-@app.get("/user_history_uuid", response_model=UserAnswerResponse)
-def read_user_answer(token: str, db: Session = Depends(get_db)):
-    session = (
-        db.query(models.UserSessionModel)
-        .filter(models.UserSessionModel.token == token)
-        .first()
+@router.get("/user_history_uuid", response_model=UserAnswerResponse)
+def read_user_answer(
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    limit = page_limit(limit, cursor)
+    # quiz_attemptsの (user_id, finished_at) インデックスを範囲スキャンする
+    query = db.query(models.QuizAttemptModel).filter(
+        models.QuizAttemptModel.user_id == user_id
     )
-
-    if session is None:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    user_answer = (
-        db.query(
-            models.UserAnswerModel.quize_list_uuid, models.UserAnswerModel.answered_at
+    if cursor is not None:
+        last_finished_at, last_id = decode_datetime_id_cursor(cursor)
+        query = query.filter(
+            or_(
+                models.QuizAttemptModel.finished_at > last_finished_at,
+                and_(
+                    models.QuizAttemptModel.finished_at == last_finished_at,
+                    models.QuizAttemptModel.id > last_id,
+                ),
+            )
         )
-        .filter(models.UserAnswerModel.user_id == session.user_id)
-        .distinct()
+    attempts = (
+        query.order_by(models.QuizAttemptModel.finished_at, models.QuizAttemptModel.id)
+        .limit(fetch_limit(limit))
+        .all()
     )
-    if user_answer is None:
-        raise HTTPException(status_code=404, detail="User answer not found")
+    next_cursor = None
+    if limit is not None and len(attempts) > limit:
+        attempts = attempts[:limit]
+        next_cursor = encode_cursor(attempts[-1].finished_at, attempts[-1].id)
 
     # モデルからスキーマに変換
     child = []
-    for answer in user_answer:
+    for attempt in attempts:
         child.append(
             UserAnswerResponseChild(
-                quize_list_uuid=answer.quize_list_uuid,
-                answered_at=answer.answered_at,
+                quize_list_uuid=attempt.quize_list_uuid,
+                answered_at=attempt.finished_at,
+                started_at=attempt.started_at,
+                question_count=attempt.question_count,
+                correct_count=attempt.correct_count,
             )
         )
-    return UserAnswerResponse(child=child)
+    return UserAnswerResponse(child=child, next_cursor=next_cursor)
 
 
 # quize_list_uuidを使って問題を分けて表示する
-@app.get("/user_history_by_uuid/", response_model=UserAnswerDetailResponse)
-def read_user_answer(quize_list_uuid: str, token: str, db: Session = Depends(get_db)):
-    session = (
-        db.query(models.UserSessionModel)
-        .filter(models.UserSessionModel.token == token)
-        .first()
-    )
-    if session is None:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    user_answers = (
+@router.get("/user_history_by_uuid/", response_model=UserAnswerDetailResponse)
+def read_user_answer(
+    quize_list_uuid: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    limit = page_limit(limit, cursor)
+    query = (
         db.query(models.UserAnswerModel, models.QuestionModel)
         .join(
             models.QuestionModel,
             models.UserAnswerModel.question_id == models.QuestionModel.id,
         )
-        .filter(models.UserAnswerModel.quize_list_uuid == quize_list_uuid)
-        .order_by(models.UserAnswerModel.id)
-        .all()
+        .filter(
+            models.UserAnswerModel.user_id == user_id,
+            models.UserAnswerModel.quize_list_uuid == quize_list_uuid,
+        )
+    )
+    if cursor is not None:
+        query = query.filter(models.UserAnswerModel.id > decode_id_cursor(cursor))
+    user_answers = (
+        query.order_by(models.UserAnswerModel.id).limit(fetch_limit(limit)).all()
     )
+    next_cursor = None
+    if limit is not None and len(user_answers) > limit:
+        user_answers = user_answers[:limit]
+        next_cursor = encode_cursor(user_answers[-1][0].id)
     if user_answers is None:
         raise HTTPException(status_code=404, detail="User answer not found")
 
@@ -272,130 +621,200 @@ def read_user_answer(quize_list_uuid: str, token: str, db: Session = Depends(get
                 answered_at=answer.answered_at,
             )
         )
-    return UserAnswerDetailResponse(child=child)
+    return UserAnswerDetailResponse(child=child, next_cursor=next_cursor)
 
 
-@app.delete("/user_history_uuid")
-def delete_user_answer(token: str, quize_list_uuid: str, db: Session = Depends(get_db)):
-    session = (
-        db.query(models.UserSessionModel)
-        .filter(models.UserSessionModel.token == token)
-        .first()
-    )
+@router.delete("/user_history_uuid")
+def delete_user_answer(
+    quize_list_uuid: str,
+    user_id: int = Depends(get_current_user_id),
+    db: Session = Depends(get_db),
+):
+    crud.delete_quiz_answers(db, user_id, quize_list_uuid)
+    db.commit()
 
-    if session is None:
-        raise HTTPException(status_code=404, detail="Session not found")
 
-    db.query(models.UserAnswerModel).filter(
-        models.UserAnswerModel.user_id == session.user_id,
-        models.UserAnswerModel.quize_list_uuid == quize_list_uuid,
-    ).delete()
-    db.commit()
+# クライアントから送られたstatusをフィードバック用の入力に変換する
+# フロントエンドはquestionIdにタグ番号（1〜5、QUESTION_TAGSの順）を入れて送る
+def parse_feedback_status(data: dict) -> List[FeedbackQuestion]:
+    status = data.get("status", [])
+
+    questions = []
+    for item in status:
+        try:
+            tag_number = int(item["questionId"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(status_code=400, detail="Invalid status")
+        # 範囲外のタグ番号はどのタグにも数えない（従来どおり）
+        if not 1 <= tag_number <= len(QUESTION_TAGS):
+            continue
+        questions.append(
+            FeedbackQuestion(
+                tag=QUESTION_TAGS[tag_number - 1],
+                is_correct=item.get(
+                    "isCorrect", False
+                ),  # Noneの場合、デフォルト値としてFalseを設定
+                time_taken=0,
+            )
+        )
+    return questions
 
 
-# Ollama APIクライアントの設定
-client = OpenAI(
-    base_url="http://localhost:11434/v1",
-    api_key="ollama",  # required, but unused
-)
+def load_user_tag_summaries(token: str) -> dict[str, TagSummary]:
+    with SessionLocal() as db:
+        user_id = resolve_user_id(db, token)
+        stats = db.scalars(crud.tag_stats_query(user_id)).all()
+    return summarize_tag_counts(
+        (stat.tag, stat.attempts, stat.correct_count) for stat in stats
+    )
 
 
-# リクエストデータのモデル定義
-class Question(BaseModel):
-    tag: str
-    is_correct: Optional[bool]  # None を許容
-    time_taken: float
+# 1回のクイズの解答をタグごとに1回のGROUP BYで集計する
+def load_quiz_tag_summaries(token: str, quize_list_uuid: str) -> dict[str, TagSummary]:
+    with SessionLocal() as db:
+        user_id = resolve_user_id(db, token)
+        counts = db.execute(
+            crud.answer_tag_counts_query(user_id, quize_list_uuid)
+        ).all()
+    if not counts:
+        raise HTTPException(status_code=404, detail="Quiz not found")
+    return summarize_tag_counts(counts)
+
+
+# フィードバックの入力（タグごとの集計）を作る
+#   token + quize_list_uuid: そのクイズの解答をサーバー側で集計する
+#   token のみ: user_tag_stats の累計成績
+#   status: クライアントが送った解答結果（旧形式）
+async def feedback_summaries(data: dict) -> dict[str, TagSummary]:
+    token = data.get("token")
+    if token is not None and data.get("quize_list_uuid") is not None:
+        return await asyncio.to_thread(
+            load_quiz_tag_summaries, token, data["quize_list_uuid"]
+        )
+    if token is not None and "status" not in data:
+        return await asyncio.to_thread(load_user_tag_summaries, token)
+    return summarize_questions(parse_feedback_status(data))
 
 
 @app.post("/generate-feedback")
 async def generate_feedback(request: Request):
-    print("generate-feedbackにアクセスがあったよ。")
+    logging.debug("generate-feedbackにアクセスがあったよ。")
     try:
         data = await request.json()
-        logging.debug(f"Received data: {data}")
+        logging.debug("Received data: %s", data)
 
-        status = data.get("status", [])
+        summaries = await feedback_summaries(data)
 
-        questions = [
-            Question(
-                tag=str(item["questionId"]),
-                is_correct=item.get(
-                    "isCorrect", False
-                ),  # Noneの場合、デフォルト値としてFalseを設定
-                time_taken=0,
-            )
-            for item in status
-        ]
-        print("questions:", questions)
-        # questions = [
-        #     Question(tag=str(item['questionId']), is_correct=item['isCorrect'], time_taken=0)
-        #     for item in status
-        # ]
-
-        feedback_results = {
-            "深層学習": generate_feedback_by_tag("1", questions),
-            "法規・倫理": generate_feedback_by_tag("2", questions),
-            "基礎数学": generate_feedback_by_tag("3", questions),
-            "AI概論": generate_feedback_by_tag("4", questions),
-            "機械学習": generate_feedback_by_tag("5", questions),
-        }
+        # テンプレートにない（またはrich指定の）タグだけLLMを並行して呼び出す
+        feedback_results = await generate_all_feedback(
+            summaries, rich=bool(data.get("rich", False))
+        )
 
         combined_feedback = "\n".join(
             f"{tag}: {text}" for tag, text in feedback_results.items()
         )
         return {"feedback": combined_feedback}
 
-        # print(f"Generated feedback: {feedback_results}")
-        # return feedback_results
-
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"Error: {e}")
         logging.error(traceback.format_exc())  # トレースバックを追加
         raise HTTPException(status_code=500, detail="Internal Server Error")
 
 
-# タグごとにフィードバックを生成する関数
-def generate_feedback_by_tag(tag: str, data: List[Question]) -> str:
-    # タグに関連付けられた問題の取得
-    tagged_questions = [item for item in data if item.tag == tag]
-    print("tagged_questions:", tagged_questions)
+# タグごとのフィードバックをServer-Sent Eventsで逐次返す
+# event: token（生成途中の差分）/ done（タグの完成文）/ error / end（全タグ完了）
+@app.post("/generate-feedback/stream")
+async def generate_feedback_stream(request: Request):
+    try:
+        data = await request.json()
+        summaries = await feedback_summaries(data)
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    rich = bool(data.get("rich", False))
+
+    async def event_stream():
+        async for event, tag, text in stream_all_feedback(summaries, rich=rich):
+            payload = json.dumps({"tag": tag, "text": text}, ensure_ascii=False)
+            yield f"event: {event}\ndata: {payload}\n\n"
+        yield "event: end\ndata: {}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-    if not tagged_questions:
-        return f"{tag}に関連するデータがありません。"
 
-    # correct_count = sum(item.is_correct for item in tagged_questions)
-    # None を False 扱いにする
-    correct_count = sum(
-        1 if item.is_correct is True else 0 for item in tagged_questions
-    )
-    total_count = len(tagged_questions)
-    avg_response_time = sum(item.time_taken for item in tagged_questions) / total_count
-    print(
-        "correct_count:",
-        correct_count,
-        "total_count:",
-        total_count,
-        "avg_response_time:",
-        avg_response_time,
-    )
+def load_user_id(token: str) -> int:
+    with SessionLocal() as db:
+        return resolve_user_id(db, token)
 
-    feedback = f"{tag}の正答率は{correct_count}/{total_count}で、平均解答時間は{avg_response_time:.2f}秒です。復習を行い、理解を深めましょう。\n"
-
-    # フィードバックをOLLAMAに生成させる
-    response = client.chat.completions.create(
-        model="ELYZA",
-        messages=[
-            {
-                "role": "system",
-                "content": "あなたはAI検定の指導者で、受験者に役立つ日本語のフィードバックを提供します。フィードバックは簡潔で正確にし、不要な英語や冗長な情報は含めないでください。",
-            },
-            {"role": "user", "content": feedback},
-        ],
+
+# フィードバック生成をバックグラウンドのジョブとして受け付け、すぐにジョブIDを返す
+# 入力は /generate-feedback と同じ（token + quize_list_uuid / token / status）
+@app.post("/feedback-jobs", status_code=202)
+async def create_feedback_job(request: Request):
+    try:
+        data = await request.json()
+        summaries = await feedback_summaries(data)
+    except HTTPException:
+        raise
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid status")
+    user_id = None
+    if data.get("token") is not None:
+        user_id = await asyncio.to_thread(load_user_id, data["token"])
+    try:
+        job_id = await feedback_job_queue.submit(
+            summaries,
+            rich=bool(data.get("rich", False)),
+            user_id=user_id,
+            quize_list_uuid=data.get("quize_list_uuid"),
+        )
+    except QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Feedback queue is full",
+            headers={"Retry-After": "5"},
+        )
+    return {"job_id": job_id, "status": "queued"}
+
+
+# このワーカーのキューの状態と、全ワーカー分の状態ごとのジョブ数
+@app.get("/feedback-jobs/stats")
+async def read_feedback_job_stats():
+    stats = feedback_job_queue.stats()
+    stats["jobs_by_status"] = await asyncio.to_thread(count_jobs_by_status)
+    return stats
+
+
+# wait秒まで完了を待ってから返す（ロングポーリング）。0ならすぐに現在の状態を返す
+@app.get("/feedback-jobs/{job_id}", response_model=FeedbackJobResponse)
+async def read_feedback_job(job_id: str, wait: float = 0):
+    if wait > 0:
+        job = await feedback_job_queue.wait(job_id, wait)
+    else:
+        job = await asyncio.to_thread(get_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return FeedbackJobResponse(
+        job_id=job.id,
+        status=job.status,
+        feedback=job.feedback,
+        error=job.error,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
     )
 
-    # フィードバックの出力
-    ollama_feedback = response.choices[0].message.content.strip()  # 不要な空白を削除
-    return ollama_feedback
+
+app.include_router(async_routes.router if USE_ASYNC_DB else router)
+
+_import_finished = time.perf_counter()
 
 
 # アプリの起動
@@ -403,21 +822,3 @@ if __name__ == "__main__":
     import uvicorn
 
     uvicorn.run(app, host="0.0.0.0", port=8000)
-
-
-@app.delete("/user_history_uuid")
-def delete_user_answer(token: str, quize_list_uuid: str, db: Session = Depends(get_db)):
-    session = (
-        db.query(models.UserSessionModel)
-        .filter(models.UserSessionModel.token == token)
-        .first()
-    )
-
-    if session is None:
-        raise HTTPException(status_code=404, detail="Session not found")
-
-    db.query(models.UserAnswerModel).filter(
-        models.UserAnswerModel.user_id == session.user_id,
-        models.UserAnswerModel.quize_list_uuid == quize_list_uuid,
-    ).delete()
-    db.commit()
@@ -0,0 +1,180 @@
+import bisect
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
+# Prometheusのテキスト形式でメトリクスを出力するための最小限の実装
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                labels = _format_labels(self.labels, label_values)
+                lines.append(f"{self.name}{labels} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        # ラベルごとに [バケットごとの件数..., +Inf件数, 合計]
+        self._values: dict[tuple[str, ...], list[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._values.get(label_values)
+            if counts is None:
+                counts = self._values[label_values] = [0.0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = self.labels + ("le",)
+        with self._lock:
+            for label_values, counts in sorted(self._values.items()):
+                cumulative = 0.0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    labels = _format_labels(names, label_values + (str(bound),))
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                cumulative += counts[len(self.buckets)]
+                labels = _format_labels(names, label_values + ("+Inf",))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labels, label_values)
+                lines.append(f"{self.name}_sum{labels} {counts[-1]}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+def render_gauges(
+    name: str, help: str, values: dict[tuple[str, ...], float], labels=()
+):
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+    for label_values, value in values.items():
+        lines.append(f"{name}{_format_labels(labels, label_values)} {value}")
+    return lines
+
+
+http_requests_total = Counter(
+    "http_requests_total", "HTTP requests.", ("method", "route", "status")
+)
+http_request_duration_seconds = Histogram(
+    "http_request_duration_seconds", "HTTP request latency.", ("method", "route")
+)
+db_queries_total = Counter(
+    "db_queries_total", "SQL statements executed per route.", ("method", "route")
+)
+db_query_seconds_total = Counter(
+    "db_query_seconds_total", "Time spent in SQL per route.", ("method", "route")
+)
+db_queries_per_request = Histogram(
+    "db_queries_per_request",
+    "SQL statements per request.",
+    ("method", "route"),
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100),
+)
+llm_request_duration_seconds = Histogram(
+    "llm_request_duration_seconds",
+    "LLM call latency per feedback tag.",
+    ("tag",),
+    buckets=LLM_BUCKETS,
+)
+llm_requests_total = Counter(
+    "llm_requests_total", "LLM calls per feedback tag.", ("tag", "outcome")
+)
+feedback_jobs_total = Counter(
+    "feedback_jobs_total", "Finished feedback jobs.", ("outcome",)
+)
+feedback_job_wait_seconds = Histogram(
+    "feedback_job_wait_seconds",
+    "Time feedback jobs spent queued before a worker picked them up.",
+    buckets=LLM_BUCKETS,
+)
+feedback_job_run_seconds = Histogram(
+    "feedback_job_run_seconds",
+    "Time workers spent generating feedback for one job.",
+    buckets=LLM_BUCKETS,
+)
+
+REGISTRY = [
+    http_requests_total,
+    http_request_duration_seconds,
+    db_queries_total,
+    db_query_seconds_total,
+    db_queries_per_request,
+    llm_request_duration_seconds,
+    llm_requests_total,
+    feedback_jobs_total,
+    feedback_job_wait_seconds,
+    feedback_job_run_seconds,
+]
+
+
+class RequestDBStats:
+    __slots__ = ("queries", "seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+
+# 処理中リクエストのSQL件数・時間（ミドルウェアが設定し、SQLのイベントで加算する）
+request_db_stats: ContextVar[Optional[RequestDBStats]] = ContextVar(
+    "request_db_stats", default=None
+)
+
+
+def record_query(elapsed: float) -> None:
+    stats = request_db_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.seconds += elapsed
+
+
+def render(extra: Optional[list[str]] = None) -> str:
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    if extra:
+        lines.extend(extra)
+    return "\n".join(lines) + "\n"
@@ -5,6 +5,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     JSON,
     Text,
 )
@@ -43,6 +44,9 @@ class FeedbackTemplateModel(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     tag = Column(String(255), nullable=True)
     feedback = Column(String(255), nullable=False)
+    # 適用する正答率の範囲（%）。Noneは下限・上限なし
+    min_rate = Column(Integer, nullable=True)
+    max_rate = Column(Integer, nullable=True)
 
 
 class UserAnswerModel(Base):
@@ -52,16 +56,70 @@ class UserAnswerModel(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     question_id = Column(Integer, ForeignKey("questions.id"), nullable=False)
     is_correct = Column(Boolean, nullable=True)
-    quize_list_uuid: str = Column(String(255), nullable=False)
+    quize_list_uuid: str = Column(String(255), nullable=False, index=True)
     answered_at = Column(DateTime, nullable=False)
 
+    # 履歴一覧・詳細・削除で使う (user_id, quize_list_uuid, answered_at) の複合インデックス
+    __table_args__ = (
+        Index(
+            "ix_user_answers_user_id_quize_list_uuid_answered_at",
+            "user_id",
+            "quize_list_uuid",
+            "answered_at",
+        ),
+    )
+
+
+class QuizAttemptModel(Base):
+    # 1回の解答（quize_list_uuid）ごとの集計。user_answersと同じトランザクションで書き込む
+    __tablename__ = "quiz_attempts"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    quize_list_uuid = Column(String(255), nullable=False, unique=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=False)
+    question_count = Column(Integer, nullable=False)
+    correct_count = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_quiz_attempts_user_id_finished_at", "user_id", "finished_at"),
+    )
+
+
+class UserTagStatModel(Base):
+    # ユーザー・タグごとの累計成績。解答の送信時に差分を加算する
+    __tablename__ = "user_tag_stats"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    tag = Column(String(255), primary_key=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    correct_count = Column(Integer, nullable=False, default=0)
+    last_answered_at = Column(DateTime, nullable=False)
+
+
+class FeedbackResultModel(Base):
+    # POST /feedback-jobs で受け付けたフィードバック生成ジョブとその結果
+    __tablename__ = "feedback_results"
+
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    quize_list_uuid = Column(String(255), nullable=True)
+    # queued / running / done / failed
+    status = Column(String(16), nullable=False)
+    feedback = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
 
 class UserSessionModel(Base):
     __tablename__ = "user_sessions"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    token = Column(String(255), nullable=False)
+    token = Column(String(255), nullable=False, index=True)
 
 
 # class UserTagModel(Base):
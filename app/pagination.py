@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException
+
+# 1ページの最大件数
+PAGE_LIMIT_MAX = 200
+# cursorだけ指定されたときの1ページの件数
+PAGE_LIMIT_DEFAULT = 100
+
+
+# キーセットページネーション用の不透明なカーソル（値のリストをbase64url化したもの）
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps(
+        [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ]
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+# id単体のカーソル
+def decode_id_cursor(cursor: str) -> int:
+    (last_id,) = decode_cursor(cursor, 1)
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return last_id
+
+
+# (日時, id) のカーソル
+def decode_datetime_id_cursor(cursor: str) -> tuple[datetime, int]:
+    last_at, last_id = decode_cursor(cursor, 2)
+    try:
+        last_at = datetime.fromisoformat(last_at)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return last_at, last_id
+
+
+def check_limit(limit: int) -> int:
+    if limit < 1 or limit > PAGE_LIMIT_MAX:
+        raise HTTPException(
+            status_code=400, detail=f"limit must be between 1 and {PAGE_LIMIT_MAX}"
+        )
+    return limit
+
+
+# limitもcursorも指定されなければNone（ページングしない既存クライアント向けに全件返す）
+def page_limit(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    if limit is None and cursor is None:
+        return None
+    return check_limit(PAGE_LIMIT_DEFAULT if limit is None else limit)
+
+
+# 次ページの有無を知るため1件多く取る（全件のときは制限しない）
+def fetch_limit(limit: Optional[int]) -> Optional[int]:
+    return None if limit is None else limit + 1
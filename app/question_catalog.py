@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import random
+import threading
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.schemas import Question
+
+# 出題カテゴリ
+QUESTION_TAGS = ["深層学習", "法規・倫理", "基礎数学", "AI概論", "機械学習"]
+
+# ブラウザ・プロキシに問題をキャッシュさせる秒数
+QUESTION_CACHE_MAX_AGE = int(os.environ.get("QUESTION_CACHE_MAX_AGE", "3600"))
+# 他のワーカーでの変更を拾うため、questionsテーブルの指紋を確認する間隔（秒、0で無効）
+QUESTION_CATALOG_CHECK_SECONDS = float(
+    os.environ.get("QUESTION_CATALOG_CHECK_SECONDS", "30")
+)
+
+
+# questionsテーブルの安い指紋（件数・最大ID・文字数の合計）
+# 追加・削除と、文字数が変わる更新を検出する。文字数の変わらない書き換えは
+# 各ワーカーで POST /questions/reload するまで反映されない
+def table_fingerprint(db: Session) -> tuple:
+    return tuple(
+        db.execute(
+            select(
+                func.count(),
+                func.max(models.QuestionModel.id),
+                func.sum(
+                    func.length(models.QuestionModel.question_text)
+                    + func.length(models.QuestionModel.correct_answer)
+                    + func.length(models.QuestionModel.commentary)
+                    + func.coalesce(func.length(models.QuestionModel.tag), 0)
+                ),
+            )
+        ).one()
+    )
+
+
+# If-None-Match の判定（RFC 9110 の弱い比較。W/ の有無は区別しない）
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for tag in if_none_match.split(",")
+    )
+
+
+class CatalogEntry:
+    __slots__ = ("question", "body", "etag")
+
+    def __init__(self, question: Question, body: bytes, etag: str):
+        self.question = question
+        self.body = body
+        self.etag = etag
+
+
+class QuestionCatalog:
+    # questionsテーブル全体を起動時に読み込み、問題ごとのJSONを事前にシリアライズして保持する
+    # 読み込みのたびに新しい辞書へ差し替えるので、参照側はロック不要
+
+    def __init__(self):
+        self._entries: Mapping[int, CatalogEntry] = MappingProxyType({})
+        self._ids_by_tag: Mapping[Optional[str], tuple[int, ...]] = MappingProxyType({})
+        self.version = ""
+        self.fingerprint: Optional[tuple] = None
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> int:
+        fingerprint = table_fingerprint(db)
+        entries = {}
+        ids_by_tag: dict[Optional[str], list[int]] = {}
+        digest = hashlib.sha1()
+        for row in db.query(models.QuestionModel).order_by(models.QuestionModel.id):
+            question = Question.model_validate(row, from_attributes=True)
+            body = question.model_dump_json().encode()
+            etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+            entries[question.id] = CatalogEntry(question, body, etag)
+            ids_by_tag.setdefault(question.tag, []).append(question.id)
+            digest.update(body)
+        with self._lock:
+            self._entries = MappingProxyType(entries)
+            self._ids_by_tag = MappingProxyType(
+                {tag: tuple(ids) for tag, ids in ids_by_tag.items()}
+            )
+            self.version = digest.hexdigest()[:16]
+            self.fingerprint = fingerprint
+        return len(entries)
+
+    # 前回読み込んだときから指紋が変わっていれば読み直す（変わっていなければNone）
+    def refresh_if_changed(self, db: Session) -> Optional[int]:
+        if table_fingerprint(db) == self.fingerprint:
+            return None
+        return self.load(db)
+
+    def get(self, question_id: int) -> Optional[CatalogEntry]:
+        return self._entries.get(question_id)
+
+    # 指定順に問題JSONを連結し、QuestionBatchResponse形式のバイト列を返す
+    def batch_body(self, question_ids: list[int]) -> bytes:
+        entries = self._entries
+        bodies = []
+        missing = []
+        for question_id in question_ids:
+            entry = entries.get(question_id)
+            if entry is None:
+                if question_id not in missing:
+                    missing.append(question_id)
+            else:
+                bodies.append(entry.body)
+        return (
+            b'{"questions":['
+            + b",".join(bodies)
+            + b'],"missing":'
+            + json.dumps(missing).encode()
+            + b"}"
+        )
+
+    # タグごとの問題ID配列から出題数分を無作為抽出する（ORDER BY RAND()は使わない）
+    def sample(self, quotas: dict[str, int], rng: random.Random) -> list[int]:
+        ids_by_tag = self._ids_by_tag
+        question_ids = []
+        for tag, count in quotas.items():
+            ids = ids_by_tag.get(tag, ())
+            question_ids.extend(rng.sample(ids, min(count, len(ids))))
+        return question_ids
+
+    # 出題数に対して問題が足りないタグと、そのタグの問題数
+    def shortfall(self, quotas: dict[str, int]) -> dict[str, int]:
+        ids_by_tag = self._ids_by_tag
+        return {
+            tag: len(ids_by_tag.get(tag, ()))
+            for tag, count in quotas.items()
+            if count > len(ids_by_tag.get(tag, ()))
+        }
+
+    # 出題するQuizResponse形式のバイト列を返す
+    def quiz_body(self, quize_list_uuid: str, question_ids: list[int]) -> bytes:
+        entries = self._entries
+        return (
+            b'{"quize_list_uuid":'
+            + json.dumps(quize_list_uuid).encode()
+            + b',"questions":['
+            + b",".join(entries[i].body for i in question_ids if i in entries)
+            + b"]}"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+question_catalog = QuestionCatalog()
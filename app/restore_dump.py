@@ -0,0 +1,454 @@
+"""mysqldump形式のダンプ（dump.txt）をMySQL / SQLiteに流し込むCLI。
+
+    python -m app.restore_dump dump.txt --database-url sqlite:///./dev.db --create-tables
+    python -m app.restore_dump dump.txt --truncate        # DATABASE_URL のDBを入れ替える
+
+ファイルを少しずつ読みながら CREATE TABLE / INSERT 文を解析し、
+行をmodelsのテーブルに合わせて変換して、chunk-size行ごとのトランザクションで
+複数行INSERTする。mysqlクライアントは不要。テーブル定義はダンプではなく
+models（alembicのスキーマ）を使い、ダンプにないquiz_attempts・user_tag_statsは
+解答から作り直す。
+"""
+
+import argparse
+import codecs
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime
+from typing import Iterator, Optional
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Table,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+
+from app import models
+from app.database import create_db_engine
+
+# 1トランザクションで書き込む行数
+RESTORE_CHUNK_SIZE = 1000
+READ_SIZE = 64 * 1024
+# 一致の後ろに最低限読んでおく文字数
+_LOOKAHEAD = 2
+
+_ESCAPES = {
+    "0": "\0",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "Z": "\x1a",
+}
+# 閉じ引用符の直後に ' が続く一致は '' の途中なので採らない
+_STRING = re.compile(r"'((?:[^'\\]|\\.|'')*)'(?!')", re.S)
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_HEX = re.compile(r"0x([0-9A-Fa-f]*)")
+_INSERT = re.compile(r"INSERT INTO `([^`]+)`(?:\s*\(([^)]*)\))?\s+VALUES\s*")
+_CREATE = re.compile(r"CREATE TABLE `([^`]+)`")
+_COLUMN = re.compile(r"^\s*`([^`]+)`\s", re.M)
+
+
+class DumpError(Exception):
+    pass
+
+
+def _unescape(value: str) -> str:
+    return re.sub(
+        r"\\(.)|''",
+        lambda m: _ESCAPES.get(m.group(1), m.group(1) or "'"),
+        value,
+        flags=re.S,
+    )
+
+
+class DumpReader:
+    # ファイルを READ_SIZE ずつ読み、文字列バッファの上で正規表現を当てる
+
+    def __init__(self, f, read_size: int = READ_SIZE):
+        self.f = f
+        self.read_size = read_size
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.bytes_read = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.f.read(self.read_size)
+        self.bytes_read += len(data)
+        if not data:
+            self.eof = True
+        self.buf = self.buf[self.pos :] + self.decoder.decode(data, final=self.eof)
+        self.pos = 0
+        return not self.eof or bool(self.buf)
+
+    def ensure(self, n: int) -> bool:
+        while len(self.buf) - self.pos < n:
+            if not self.fill():
+                return False
+        return True
+
+    def startswith(self, prefix: str) -> bool:
+        self.ensure(len(prefix))
+        return self.buf.startswith(prefix, self.pos)
+
+    def skip_space(self) -> bool:
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return True
+            if not self.fill():
+                return False
+
+    def skip_past(self, marker: str) -> None:
+        while True:
+            index = self.buf.find(marker, self.pos)
+            if index >= 0:
+                self.pos = index + len(marker)
+                return
+            if self.eof:
+                self.pos = len(self.buf)
+                return
+            # マーカーがバッファの境界をまたぐ場合に備えて末尾を残す
+            self.pos = max(self.pos, len(self.buf) - len(marker) + 1)
+            self.fill()
+
+    def match(self, pattern: re.Pattern) -> Optional[re.Match]:
+        # バッファの末尾で切れた一致を避けるため、必要なら読み足して照合し直す
+        # 一致の直後が末尾に近いときも読み足す（1.5e+ の手前で止まった一致などを採らない）
+        while True:
+            m = pattern.match(self.buf, self.pos)
+            if m is not None and (m.end() + _LOOKAHEAD < len(self.buf) or self.eof):
+                self.pos = m.end()
+                return m
+            if not self.fill():
+                return None
+
+    def read_statement(self) -> str:
+        # 引用符の外にある ; までを1文として返す（INSERT以外の短い文用）
+        start = self.pos
+        quote = None
+        i = self.pos
+        while True:
+            if i >= len(self.buf):
+                offset = i - start
+                self.pos = start
+                if not self.fill():
+                    statement = self.buf[self.pos :]
+                    self.pos = len(self.buf)
+                    return statement
+                start = self.pos
+                i = start + offset
+                continue
+            char = self.buf[i]
+            if quote:
+                if char == "\\":
+                    i += 1
+                elif char == quote:
+                    quote = None
+            elif char in "'\"`":
+                quote = char
+            elif char == ";":
+                self.pos = i + 1
+                return self.buf[start:i]
+            i += 1
+
+    def next_char(self) -> str:
+        if not self.skip_space():
+            raise DumpError("unexpected end of dump")
+        char = self.buf[self.pos]
+        self.pos += 1
+        return char
+
+    def expect(self, char: str) -> None:
+        found = self.next_char()
+        if found != char:
+            raise DumpError(f"expected {char!r} but found {found!r}")
+
+    def read_value(self):
+        self.skip_space()
+        if self.startswith("NULL"):
+            self.pos += 4
+            return None
+        if self.startswith("_binary "):
+            self.pos += len("_binary ")
+        # 先頭の文字で値の種類を決める（合わない正規表現で末尾まで読み足さないように）
+        if self.startswith("'"):
+            m = self.match(_STRING)
+            if m is not None:
+                return _unescape(m.group(1))
+        elif self.startswith("0x"):
+            m = self.match(_HEX)
+            if m is not None:
+                return bytes.fromhex(m.group(1))
+        else:
+            m = self.match(_NUMBER)
+            if m is not None:
+                number = m.group(0)
+                if "." in number or "e" in number.lower():
+                    return float(number)
+                return int(number)
+        raise DumpError(f"cannot parse value near {self.buf[self.pos:][:20]!r}")
+
+    def read_rows(self) -> Iterator[tuple]:
+        # (v, v, ...),(v, ...); を1行ずつ返す
+        while True:
+            self.expect("(")
+            row = []
+            while True:
+                row.append(self.read_value())
+                char = self.next_char()
+                if char == ")":
+                    break
+                if char != ",":
+                    raise DumpError(f"unexpected {char!r} in VALUES")
+            yield tuple(row)
+            char = self.next_char()
+            if char == ";":
+                return
+            if char != ",":
+                raise DumpError(f"unexpected {char!r} after row")
+
+
+def parse_dump(reader: DumpReader) -> Iterator[tuple[str, str, list]]:
+    # ("create", テーブル名, 列名リスト) と ("row", テーブル名, {列名: 値}) を順に返す
+    columns: dict[str, list[str]] = {}
+    while reader.skip_space():
+        if reader.startswith("--"):
+            reader.skip_past("\n")
+        elif reader.startswith("/*"):
+            reader.skip_past("*/")
+            reader.skip_space()
+            if reader.startswith(";"):
+                reader.pos += 1
+        elif reader.startswith("INSERT"):
+            m = reader.match(_INSERT)
+            if m is None:
+                raise DumpError("cannot parse INSERT statement")
+            table = m.group(1)
+            if m.group(2):
+                names = [name.strip(" `") for name in m.group(2).split(",")]
+            else:
+                names = columns.get(table)
+                if names is None:
+                    raise DumpError(f"INSERT into {table} before CREATE TABLE")
+            for row in reader.read_rows():
+                yield "row", table, dict(zip(names, row))
+        else:
+            statement = reader.read_statement()
+            m = _CREATE.match(statement.lstrip())
+            if m is not None:
+                # 列定義の行だけを拾う（KEY / CONSTRAINT 行は ` で始まらない）
+                columns[m.group(1)] = _COLUMN.findall(statement)
+                yield "create", m.group(1), columns[m.group(1)]
+
+
+def convert_row(table: Table, row: dict) -> dict:
+    converted = {}
+    for name, value in row.items():
+        column = table.columns.get(name)
+        if column is None:
+            continue
+        if value is not None:
+            if isinstance(column.type, JSON) and isinstance(value, str):
+                value = json.loads(value)
+            elif isinstance(column.type, DateTime) and isinstance(value, str):
+                value = datetime.fromisoformat(value)
+            elif isinstance(column.type, Boolean):
+                value = bool(value)
+        converted[name] = value
+    return converted
+
+
+def disable_foreign_keys(connection) -> None:
+    # ダンプはテーブル名順なので、参照先より先に参照元の行が来る
+    if connection.dialect.name == "mysql":
+        connection.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+    elif connection.dialect.name == "sqlite":
+        connection.execute(text("PRAGMA foreign_keys=OFF"))
+
+
+def rebuild_quiz_attempts(engine: Engine) -> int:
+    answers = models.UserAnswerModel
+    attempts = models.QuizAttemptModel
+    query = (
+        select(
+            answers.quize_list_uuid,
+            func.min(answers.user_id),
+            func.min(answers.answered_at),
+            func.max(answers.answered_at),
+            func.count(),
+            func.sum(case((answers.is_correct, 1), else_=0)),
+        )
+        .where(answers.quize_list_uuid.not_in(select(attempts.quize_list_uuid)))
+        .group_by(answers.quize_list_uuid)
+    )
+    with engine.begin() as connection:
+        result = connection.execute(
+            insert(attempts).from_select(
+                [
+                    "quize_list_uuid",
+                    "user_id",
+                    "started_at",
+                    "finished_at",
+                    "question_count",
+                    "correct_count",
+                ],
+                query,
+            )
+        )
+    return result.rowcount
+
+
+def rebuild_user_tag_stats(engine: Engine) -> int:
+    answers = models.UserAnswerModel
+    questions = models.QuestionModel
+    stats = models.UserTagStatModel
+    query = (
+        select(
+            answers.user_id,
+            questions.tag,
+            func.count(),
+            func.sum(case((answers.is_correct, 1), else_=0)),
+            func.max(answers.answered_at),
+        )
+        .join(questions, questions.id == answers.question_id)
+        .where(questions.tag.is_not(None))
+        .group_by(answers.user_id, questions.tag)
+    )
+    with engine.begin() as connection:
+        connection.execute(delete(stats))
+        result = connection.execute(
+            insert(stats).from_select(
+                ["user_id", "tag", "attempts", "correct_count", "last_answered_at"],
+                query,
+            )
+        )
+    return result.rowcount
+
+
+def restore(
+    path: str,
+    engine: Engine,
+    chunk_size: int = RESTORE_CHUNK_SIZE,
+    truncate: bool = False,
+    progress=None,
+) -> dict[str, int]:
+    tables = models.Base.metadata.tables
+    counts: dict[str, int] = {}
+    pending: list[dict] = []
+    pending_table: Optional[Table] = None
+    total_bytes = os.path.getsize(path)
+
+    def flush():
+        nonlocal pending
+        if not pending:
+            return
+        with engine.begin() as connection:
+            disable_foreign_keys(connection)
+            connection.execute(insert(pending_table).values(pending))
+        counts[pending_table.name] = counts.get(pending_table.name, 0) + len(pending)
+        pending = []
+        if progress:
+            progress(
+                pending_table.name,
+                counts[pending_table.name],
+                reader.bytes_read,
+                total_bytes,
+            )
+
+    if truncate:
+        with engine.begin() as connection:
+            disable_foreign_keys(connection)
+            for table in reversed(models.Base.metadata.sorted_tables):
+                connection.execute(delete(table))
+
+    with open(path, "rb") as f:
+        reader = DumpReader(f)
+        for kind, name, payload in parse_dump(reader):
+            table = tables.get(name)
+            if table is None:
+                if kind == "create":
+                    print(f"skipping unknown table {name}", file=sys.stderr)
+                continue
+            if kind == "create":
+                counts.setdefault(name, 0)
+                continue
+            if table is not pending_table:
+                flush()
+                pending_table = table
+            pending.append(convert_row(table, payload))
+            if len(pending) >= chunk_size:
+                flush()
+        flush()
+
+    if counts.get("user_answers") and "quiz_attempts" not in counts:
+        counts["quiz_attempts"] = rebuild_quiz_attempts(engine)
+    if counts.get("user_answers") and "user_tag_stats" not in counts:
+        counts["user_tag_stats"] = rebuild_user_tag_stats(engine)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("path", nargs="?", default="dump.txt")
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--chunk-size", type=int, default=RESTORE_CHUNK_SIZE)
+    parser.add_argument(
+        "--create-tables",
+        action="store_true",
+        help="create missing tables first (normally done by alembic upgrade head)",
+    )
+    parser.add_argument(
+        "--truncate", action="store_true", help="delete existing rows first"
+    )
+    args = parser.parse_args()
+
+    if args.database_url:
+        engine = create_db_engine(args.database_url)
+    else:
+        from app.database import engine
+    if args.create_tables:
+        models.Base.metadata.create_all(bind=engine)
+
+    def progress(table, rows, done, total):
+        print(
+            f"\r{done * 100 // max(total, 1):3d}% {table}: {rows} rows",
+            end="",
+            file=sys.stderr,
+            flush=True,
+        )
+
+    start = time.perf_counter()
+    try:
+        counts = restore(
+            args.path, engine, args.chunk_size, args.truncate, progress=progress
+        )
+    except (OSError, ValueError, DumpError) as e:
+        print(f"\n{e}", file=sys.stderr)
+        sys.exit(1)
+    print(file=sys.stderr)
+    for table, rows in counts.items():
+        print(f"{table}: {rows} rows")
+    print(f"restored in {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -47,6 +47,32 @@ class Question(BaseModel):
         orm_mode = True
 
 
+class QuestionBatchRequest(BaseModel):
+    ids: list[int] = Field(description="問題IDのリスト")
+
+
+class QuestionBatchResponse(BaseModel):
+    questions: list[Question]
+    missing: list[int]
+
+
+# 1回のクイズの最大出題数（quotasの合計にも適用する）
+QUIZ_MAX_COUNT = 300
+
+
+class QuizCreate(BaseModel):
+    count: int = Field(default=10, ge=1, le=QUIZ_MAX_COUNT, description="出題数")
+    quotas: Optional[dict[str, int]] = Field(
+        default=None, description="タグごとの出題数（省略時はcountを全タグに均等配分）"
+    )
+    seed: Optional[int] = Field(default=None, description="乱数シード")
+
+
+class QuizResponse(BaseModel):
+    quize_list_uuid: str
+    questions: list[Question]
+
+
 class Session(BaseModel):
     id: int
     user_id: int
@@ -64,14 +90,20 @@ class FeedbackTemplate(BaseModel):
     id: int
     tag: str | None = None
     feedback: str
+    min_rate: int | None = None
+    max_rate: int | None = None
 
     class Config:
         orm_mode = True
 
+
 class QuestionCreateChild(BaseModel):
     question_id: int = Field(description="問題ID")
-    is_correct: Optional[bool] = Field(default=False, description="正解かどうか")  # デフォルト値を False に設定
-    
+    is_correct: Optional[bool] = Field(
+        default=False, description="正解かどうか"
+    )  # デフォルト値を False に設定
+
+
 class UserAnswer(BaseModel):
     id: int
     user_id: int
@@ -86,12 +118,19 @@ class UserAnswer(BaseModel):
 
 class UserAnswerCreate(BaseModel):
     token: str = Field(description="トークン")
-    child: list["QuestionCreateChild"] = Field(description="回答情報")
+    child: list["QuestionCreateChild"] = Field(description="回答情報", min_length=1)
+    quize_list_uuid: Optional[str] = Field(
+        default=None, description="POST /quizzes で発行されたクイズのUUID"
+    )
+    started_at: Optional[datetime] = Field(
+        default=None, description="解答開始時刻（省略時は送信時刻）"
+    )
 
 
 class UserAnswerDetailResponse(BaseModel):
 
     child: list["UserAnswerDetailResponseChild"]
+    next_cursor: str | None = None
 
     class Config:
         orm_mode = True
@@ -115,6 +154,7 @@ class UserAnswerDetailResponseChild(BaseModel):
 
 class UserAnswerResponse(BaseModel):
     child: list["UserAnswerResponseChild"]
+    next_cursor: str | None = None
 
     class Config:
         orm_mode = True
@@ -123,6 +163,37 @@ class UserAnswerResponse(BaseModel):
 class UserAnswerResponseChild(BaseModel):
     quize_list_uuid: str
     answered_at: datetime
+    started_at: datetime | None = None
+    question_count: int | None = None
+    correct_count: int | None = None
 
     class Config:
         orm_mode = True
+
+
+class UserTagStatsResponse(BaseModel):
+    child: list["UserTagStatsResponseChild"]
+
+    class Config:
+        orm_mode = True
+
+
+class UserTagStatsResponseChild(BaseModel):
+    tag: str
+    attempts: int
+    correct_count: int
+    accuracy: float
+    last_answered_at: datetime
+
+    class Config:
+        orm_mode = True
+
+
+class FeedbackJobResponse(BaseModel):
+    job_id: str
+    status: str
+    feedback: Optional[dict[str, str]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
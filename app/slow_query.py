@@ -0,0 +1,49 @@
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app import metrics
+
+# この時間（ミリ秒）を超えたSQLだけをログに出す。負の値で無効
+SLOW_QUERY_THRESHOLD_MS = float(os.environ.get("SLOW_QUERY_THRESHOLD_MS", "200"))
+# ログに残すSQL文の最大長
+SLOW_QUERY_MAX_STATEMENT = 2000
+
+# 現在処理中のエンドポイント（ミドルウェアが設定する）
+current_endpoint: ContextVar[str] = ContextVar("current_endpoint", default="-")
+
+logger = logging.getLogger("app.slow_query")
+
+
+# SQLの実行時間を計測し、リクエストごとのメトリクスへの加算と遅いSQLのログ出力を行う
+def install(engine: Engine, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS) -> None:
+    threshold = threshold_ms / 1000 if threshold_ms >= 0 else None
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+        metrics.record_query(elapsed)
+        if threshold is None or elapsed < threshold:
+            return
+        logger.warning(
+            json.dumps(
+                {
+                    "event": "slow_query",
+                    "duration_ms": round(elapsed * 1000, 2),
+                    "endpoint": current_endpoint.get(),
+                    "statement": " ".join(statement.split())[:SLOW_QUERY_MAX_STATEMENT],
+                },
+                ensure_ascii=False,
+            )
+        )
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import inspect
+from sqlalchemy.pool import QueuePool
+
+from app import models
+from app.database import POOL_OPTIONS, SessionLocal, async_engine, engine
+from app.feedback import get_client
+from app.feedback_cache import feedback_cache
+from app.feedback_templates import template_index
+from app.question_catalog import QUESTION_CATALOG_CHECK_SECONDS, question_catalog
+
+# 起動時のスキーマ確認
+#   create: 足りないテーブルを作る（開発用）
+#   check:  テーブルがそろっているかだけ確認し、なければ起動を止める（alembicで管理する本番用）
+#   none:   何もしない
+DB_SCHEMA = os.environ.get("DB_SCHEMA", "create").lower()
+# 起動時に先に接続しておく本数（pool_sizeが上限）
+DB_POOL_WARMUP = int(os.environ.get("DB_POOL_WARMUP", "2"))
+# 起動にかかった時間がこの秒数を超えたら警告を出す（0で無効）
+STARTUP_BUDGET_SECONDS = float(os.environ.get("STARTUP_BUDGET_SECONDS", "0"))
+
+logger = logging.getLogger("app.startup")
+
+
+class StartupTimings:
+    # 起動処理の段階ごとの所要時間（秒）
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            self.phases[phase] = seconds
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {"total_seconds": self.total, "phases": dict(self.phases)}
+
+
+startup_timings = StartupTimings()
+
+
+def ensure_schema() -> None:
+    if DB_SCHEMA == "create":
+        models.Base.metadata.create_all(bind=engine)
+    elif DB_SCHEMA == "check":
+        missing = set(models.Base.metadata.tables) - set(
+            inspect(engine).get_table_names()
+        )
+        if missing:
+            raise RuntimeError(
+                f"missing tables: {', '.join(sorted(missing))}"
+                " (run `alembic upgrade head`)"
+            )
+
+
+def warmup_size(pool) -> int:
+    if not isinstance(pool, QueuePool):
+        return min(DB_POOL_WARMUP, 1)
+    return min(DB_POOL_WARMUP, POOL_OPTIONS["pool_size"])
+
+
+# 接続を同時に開いてすぐ返し、最初のリクエストで接続を待たないようにする
+async def prime_pool() -> None:
+    connections = await asyncio.gather(
+        *(asyncio.to_thread(engine.connect) for _ in range(warmup_size(engine.pool)))
+    )
+    for connection in connections:
+        connection.close()
+
+
+async def prime_async_pool() -> None:
+    connections = [
+        async_engine.connect()
+        for _ in range(warmup_size(async_engine.sync_engine.pool))
+    ]
+    await asyncio.gather(*(connection.start() for connection in connections))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+
+def load_question_catalog() -> None:
+    with SessionLocal() as db:
+        question_catalog.load(db)
+
+
+def refresh_question_catalog() -> None:
+    with SessionLocal() as db:
+        count = question_catalog.refresh_if_changed(db)
+    if count is not None:
+        logger.info(f"question catalog reloaded: {count} questions")
+
+
+# POST /questions/reload は受けたワーカーしか読み直さないので、
+# 各ワーカーが定期的にquestionsテーブルの指紋を見て、変わっていれば読み直す
+async def watch_question_catalog() -> None:
+    while True:
+        await asyncio.sleep(QUESTION_CATALOG_CHECK_SECONDS)
+        try:
+            await asyncio.to_thread(refresh_question_catalog)
+        except Exception:
+            logger.exception("question catalog check failed")
+
+
+def load_feedback_templates() -> None:
+    with SessionLocal() as db:
+        template_index.load(db)
+
+
+async def timed(phase: str, step) -> None:
+    start = time.perf_counter()
+    if asyncio.iscoroutinefunction(step):
+        await step()
+    else:
+        await asyncio.to_thread(step)
+    startup_timings.record(phase, time.perf_counter() - start)
+
+
+# lifespanから1回だけ呼ぶ。スキーマ確認の後、残りの準備を並行して行う
+async def warmup() -> None:
+    start = time.perf_counter()
+    await timed("schema", ensure_schema)
+    steps = {
+        "db_pool": prime_pool,
+        "question_catalog": load_question_catalog,
+        "feedback_templates": load_feedback_templates,
+        "feedback_cache": feedback_cache.open,
+        "llm_client": get_client,
+    }
+    if async_engine is not None:
+        steps["async_db_pool"] = prime_async_pool
+    await asyncio.gather(*(timed(phase, step) for phase, step in steps.items()))
+    startup_timings.total = (
+        time.perf_counter() - start + startup_timings.phases.get("import", 0.0)
+    )
+
+    summary = json.dumps(startup_timings.as_dict())
+    if 0 < STARTUP_BUDGET_SECONDS < startup_timings.total:
+        logger.warning(f"startup exceeded {STARTUP_BUDGET_SECONDS}s: {summary}")
+    else:
+        logger.info(f"startup: {summary}")
@@ -0,0 +1,178 @@
+"""履歴系クエリのインデックス有無による遅延比較ベンチマーク。
+
+合成データ（ユーザー・セッション・解答）を --answers 行投入し、
+user_sessions.token / user_answers.quize_list_uuid / 複合インデックスを
+外した状態と付けた状態で、各エンドポイントが発行するクエリの遅延を測る。
+
+    python -m benchmarks.bench_history_indexes --url sqlite:///bench.db --answers 2000000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, delete, insert, select
+from sqlalchemy.orm import sessionmaker
+
+from app import models
+
+INDEXES = [
+    index
+    for table in (models.UserSessionModel.__table__, models.UserAnswerModel.__table__)
+    for index in table.indexes
+    if index.name
+    in (
+        "ix_user_sessions_token",
+        "ix_user_answers_quize_list_uuid",
+        "ix_user_answers_user_id_quize_list_uuid_answered_at",
+    )
+]
+
+
+def load(engine, users, questions, answers, quiz_size, chunk_size=10000):
+    rng = random.Random(0)
+    tokens = []
+    attempts = []
+    with engine.begin() as conn:
+        conn.execute(
+            insert(models.UserModel),
+            [
+                {
+                    "id": i,
+                    "name": f"u{i}",
+                    "email": f"u{i}@example.com",
+                    "password": "x",
+                }
+                for i in range(1, users + 1)
+            ],
+        )
+        conn.execute(
+            insert(models.QuestionModel),
+            [
+                {
+                    "id": i,
+                    "question_text": f"q{i}",
+                    "correct_answer": "a",
+                    "choices": ["a", "b", "c", "d"],
+                    "commentary": "",
+                    "tag": "深層学習",
+                }
+                for i in range(1, questions + 1)
+            ],
+        )
+        for user_id in range(1, users + 1):
+            token = uuid.uuid4().hex
+            tokens.append((token, user_id))
+        conn.execute(
+            insert(models.UserSessionModel),
+            [{"user_id": u, "token": t} for t, u in tokens],
+        )
+
+    start = datetime(2025, 1, 1)
+    rows = []
+    written = 0
+    while written < answers:
+        user_id = rng.randint(1, users)
+        quize_list_uuid = str(uuid.uuid4())
+        answered_at = start + timedelta(seconds=written)
+        attempts.append((user_id, quize_list_uuid))
+        for question_id in range(1, min(quiz_size, answers - written) + 1):
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "question_id": question_id,
+                    "is_correct": rng.random() < 0.6,
+                    "quize_list_uuid": quize_list_uuid,
+                    "answered_at": answered_at,
+                }
+            )
+        written += min(quiz_size, answers - written)
+        if len(rows) >= chunk_size or written >= answers:
+            with engine.begin() as conn:
+                conn.execute(insert(models.UserAnswerModel), rows)
+            rows = []
+            print(f"\rloaded {written}/{answers} answers", end="", flush=True)
+    print()
+    return tokens, attempts
+
+
+def measure(SessionLocal, tokens, attempts, samples):
+    rng = random.Random(1)
+    answer = models.UserAnswerModel
+    results = {}
+    queries = {
+        "session by token": lambda db, token, user_id, uuid_: db.execute(
+            select(models.UserSessionModel.user_id).where(
+                models.UserSessionModel.token == token
+            )
+        ).first(),
+        "/user_history_uuid": lambda db, token, user_id, uuid_: db.execute(
+            select(answer.quize_list_uuid, answer.answered_at)
+            .where(answer.user_id == user_id)
+            .distinct()
+        ).all(),
+        "/user_history_by_uuid/": lambda db, token, user_id, uuid_: db.execute(
+            select(answer, models.QuestionModel)
+            .join(models.QuestionModel, answer.question_id == models.QuestionModel.id)
+            .where(answer.user_id == user_id, answer.quize_list_uuid == uuid_)
+            .order_by(answer.id)
+        ).all(),
+        "DELETE /user_history_uuid": lambda db, token, user_id, uuid_: db.execute(
+            delete(answer).where(
+                answer.user_id == user_id, answer.quize_list_uuid == uuid_
+            )
+        ),
+    }
+    user_tokens = dict((u, t) for t, u in tokens)
+    for name, query in queries.items():
+        timings = []
+        with SessionLocal() as db:
+            for _ in range(samples):
+                user_id, quize_list_uuid = rng.choice(attempts)
+                t0 = time.perf_counter()
+                query(db, user_tokens[user_id], user_id, quize_list_uuid)
+                timings.append((time.perf_counter() - t0) * 1000)
+            # DELETEはロールバックして次の計測に影響させない
+            db.rollback()
+        results[name] = statistics.median(timings)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite:///bench_history.db")
+    parser.add_argument("--answers", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--questions", type=int, default=287)
+    parser.add_argument("--quiz-size", type=int, default=50)
+    parser.add_argument("--samples", type=int, default=50)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    for index in INDEXES:
+        index.drop(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    tokens, attempts = load(
+        engine, args.users, args.questions, args.answers, args.quiz_size
+    )
+
+    without = measure(SessionLocal, tokens, attempts, args.samples)
+    t0 = time.perf_counter()
+    for index in INDEXES:
+        index.create(bind=engine)
+    print(f"index build: {time.perf_counter() - t0:.2f}s")
+    with_ = measure(SessionLocal, tokens, attempts, args.samples)
+
+    print(f"{'query':<28}{'no index (ms)':>16}{'indexed (ms)':>16}")
+    for name in without:
+        print(f"{name:<28}{without[name]:>16.3f}{with_[name]:>16.3f}")
+
+
+if __name__ == "__main__":
+    main()
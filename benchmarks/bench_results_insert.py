@@ -0,0 +1,98 @@
+"""POST /results/ の書き込み経路のベンチマーク。
+
+1行ずつ add+flush する旧実装と、複数行INSERTでまとめて書き込む
+crud.insert_user_answers を比較し、rows/sec を表示する。
+
+    python -m benchmarks.bench_results_insert --url mysql+mysqlconnector://root:@localhost:3306/bench
+"""
+
+import argparse
+import time
+import uuid
+from datetime import datetime
+
+from sqlalchemy import create_engine, delete
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models
+from app.schemas import QuestionCreateChild
+
+
+def per_row_insert(db, user_id, child):
+    # 旧実装: 1問ごとに add + flush
+    quize_list_uuid = str(uuid.uuid4())
+    for question in child:
+        new_question = models.UserAnswerModel(
+            user_id=user_id,
+            question_id=question.question_id,
+            is_correct=question.is_correct,
+            quize_list_uuid=quize_list_uuid,
+            answered_at=datetime.now(),
+        )
+        db.add(new_question)
+        db.flush()
+    db.commit()
+    db.refresh(new_question)
+    return quize_list_uuid
+
+
+def bulk_insert(db, user_id, child):
+    quize_list_uuid = crud.insert_user_answers(db, user_id, child)
+    db.commit()
+    return quize_list_uuid
+
+
+def seed(SessionLocal, questions):
+    with SessionLocal() as db:
+        db.execute(delete(models.UserAnswerModel))
+        db.execute(delete(models.QuizAttemptModel))
+        db.execute(delete(models.UserTagStatModel))
+        db.execute(delete(models.QuestionModel))
+        db.execute(delete(models.UserModel))
+        db.add(models.UserModel(id=1, name="bench", email="bench", password="bench"))
+        db.add_all(
+            models.QuestionModel(
+                id=i,
+                question_text=f"q{i}",
+                correct_answer="a",
+                choices=["a", "b", "c", "d"],
+                commentary="",
+                tag="深層学習",
+            )
+            for i in range(1, questions + 1)
+        )
+        db.commit()
+
+
+def run(SessionLocal, func, child, quizzes):
+    start = time.perf_counter()
+    for _ in range(quizzes):
+        with SessionLocal() as db:
+            func(db, 1, child)
+    elapsed = time.perf_counter() - start
+    return quizzes * len(child) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite://")
+    parser.add_argument("--questions", type=int, default=100)
+    parser.add_argument("--quizzes", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    models.Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    seed(SessionLocal, args.questions)
+
+    child = [
+        QuestionCreateChild(question_id=i, is_correct=i % 2 == 0)
+        for i in range(1, args.questions + 1)
+    ]
+    for name, func in (("per-row add+flush", per_row_insert), ("bulk", bulk_insert)):
+        rows_per_sec = run(SessionLocal, func, child, args.quizzes)
+        print(f"{name:>20}: {rows_per_sec:10.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
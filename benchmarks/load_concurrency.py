@@ -0,0 +1,102 @@
+"""同時接続数を増やしたときのスループットを測る負荷テスト。
+
+同期版（既定）と非同期版（USE_ASYNC_DB=1）のサーバーをそれぞれ起動し、
+同じ条件で実行して比べる。同期版はスレッドプール（既定40）で頭打ちになる。
+
+    uvicorn app.main:app --port 8000
+    USE_ASYNC_DB=1 uvicorn app.main:app --port 8001
+    python -m benchmarks.load_concurrency --base-url http://localhost:8000
+    python -m benchmarks.load_concurrency --base-url http://localhost:8001
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def prepare(client: httpx.AsyncClient) -> str:
+    email = f"load-{uuid.uuid4().hex[:8]}@example.com"
+    r = await client.post(
+        "/users/", json={"name": "load", "email": email, "password": "load"}
+    )
+    r.raise_for_status()
+    r = await client.post("/login/", json={"email": email, "password": "load"})
+    r.raise_for_status()
+    token = r.json()["token"]
+    r = await client.post(
+        "/results/",
+        json={
+            "token": token,
+            "child": [
+                {"question_id": i, "is_correct": i % 2 == 0} for i in range(1, 11)
+            ],
+        },
+    )
+    r.raise_for_status()
+    return token
+
+
+async def run_level(client, path, params, concurrency, requests):
+    latencies = []
+    errors = 0
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+
+    async def worker():
+        nonlocal errors
+        while not queue.empty():
+            queue.get_nowait()
+            t0 = time.perf_counter()
+            try:
+                r = await client.get(path, params=params)
+                if r.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "errors": errors,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/user_history_uuid")
+    parser.add_argument("--levels", default="10,40,80,160,320")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(
+        base_url=args.base_url, limits=limits, timeout=60
+    ) as client:
+        token = await prepare(client)
+        print(
+            f"{'concurrency':>12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}"
+        )
+        for level in (int(v) for v in args.levels.split(",")):
+            result = await run_level(
+                client, args.path, {"token": token}, level, args.requests
+            )
+            print(
+                f"{level:>12}{result['rps']:>10.0f}{result['p50']:>10.1f}"
+                f"{result['p95']:>10.1f}{result['errors']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
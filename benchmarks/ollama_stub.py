@@ -0,0 +1,155 @@
+"""Ollamaの代わりに使うOpenAI互換のスタブサーバー。
+
+/v1/chat/completions（stream=Trueを含む）と /v1/models に応答する。
+応答はプロンプトから決まる定型の日本語文で、エラーの発生もSTUB_SEEDで
+固定した乱数で決まるため、同じ設定なら毎回同じ結果になる。
+
+    STUB_LATENCY=0.5 STUB_TOKEN_RATE=50 uvicorn benchmarks.ollama_stub:app --port 11500
+    python -m benchmarks.ollama_stub --port 11500 --latency 0.5 --error-rate 0.1
+
+アプリ側は OLLAMA_BASE_URL=http://127.0.0.1:11500/v1 で向き先を切り替える。
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+import uuid
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# 最初のトークンを返すまでの秒数
+STUB_LATENCY = float(os.environ.get("STUB_LATENCY", "0.5"))
+# 1秒あたりに返すトークン数（1文字を1トークンとして数える、0以下なら待たない）
+STUB_TOKEN_RATE = float(os.environ.get("STUB_TOKEN_RATE", "0"))
+# 500エラーを返す割合（0〜1）
+STUB_ERROR_RATE = float(os.environ.get("STUB_ERROR_RATE", "0"))
+STUB_SEED = int(os.environ.get("STUB_SEED", "0"))
+STUB_MODEL = os.environ.get("STUB_MODEL", "ELYZA")
+
+CANNED_RESPONSES = [
+    "基本的な理解はできています。間違えた問題の解説を読み直し、関連する用語を整理して復習しましょう。",
+    "正答率が高く、よく理解できています。この調子で応用的な問題にも挑戦してみましょう。",
+    "まだ理解が不十分な分野です。教科書の該当する章に戻り、基本的な定義から確認しましょう。",
+    "解答に時間がかかっている問題が多いようです。頻出のキーワードを覚えて、素早く判断できるようにしましょう。",
+    "惜しい問題がいくつかありました。選択肢の違いに注目しながら、解説をもう一度確認しましょう。",
+]
+
+app = FastAPI()
+rng = random.Random(STUB_SEED)
+
+
+# 同じプロンプトには常に同じ応答を返す
+def pick_response(messages: list[dict]) -> str:
+    prompt = "".join(str(message.get("content", "")) for message in messages)
+    digest = hashlib.sha1(prompt.encode("utf-8")).digest()
+    return CANNED_RESPONSES[digest[0] % len(CANNED_RESPONSES)]
+
+
+def token_delay() -> float:
+    return 1.0 / STUB_TOKEN_RATE if STUB_TOKEN_RATE > 0 else 0.0
+
+
+def error_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=500,
+        content={
+            "error": {
+                "message": "stub: injected error",
+                "type": "server_error",
+                "code": None,
+            }
+        },
+    )
+
+
+@app.get("/v1/models")
+async def list_models():
+    return {
+        "object": "list",
+        "data": [
+            {"id": STUB_MODEL, "object": "model", "created": 0, "owned_by": "stub"}
+        ],
+    }
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+    created = int(time.time())
+    model = body.get("model", STUB_MODEL)
+    content = pick_response(body.get("messages", []))
+
+    await asyncio.sleep(STUB_LATENCY)
+    if rng.random() < STUB_ERROR_RATE:
+        return error_response()
+
+    if body.get("stream"):
+
+        def chunk(delta: dict, finish_reason=None) -> str:
+            data = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                ],
+            }
+            return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+        async def events():
+            yield chunk({"role": "assistant", "content": ""})
+            delay = token_delay()
+            for char in content:
+                if delay:
+                    await asyncio.sleep(delay)
+                yield chunk({"content": char})
+            yield chunk({}, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    await asyncio.sleep(token_delay() * len(content))
+    return {
+        "id": completion_id,
+        "object": "chat.completion",
+        "created": created,
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {
+            "prompt_tokens": 0,
+            "completion_tokens": len(content),
+            "total_tokens": len(content),
+        },
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11500)
+    parser.add_argument("--latency", type=float, default=STUB_LATENCY)
+    parser.add_argument("--token-rate", type=float, default=STUB_TOKEN_RATE)
+    parser.add_argument("--error-rate", type=float, default=STUB_ERROR_RATE)
+    parser.add_argument("--seed", type=int, default=STUB_SEED)
+    args = parser.parse_args()
+
+    STUB_LATENCY = args.latency
+    STUB_TOKEN_RATE = args.token_rate
+    STUB_ERROR_RATE = args.error_rate
+    rng.seed(args.seed)
+    uvicorn.run(app, host=args.host, port=args.port)
@@ -0,0 +1,337 @@
+"""全エンドポイントの負荷テスト・ベンチマーク。
+
+合成データ（ユーザー・セッション・問題・解答）を投入したローカルDBと
+Ollamaスタブ（benchmarks.ollama_stub）を使ってアプリを起動し、
+ログイン → 出題 → 解答送信 → 履歴 → フィードバック の流れを
+仮想ユーザーが並行して繰り返す。エンドポイントごとの p50/p95/p99 と
+req/s を表示し、--output でリリース間の比較に使えるJSONを書き出す。
+
+    python -m benchmarks.run_suite --users 200 --concurrency 50 --duration 30 --output bench.json
+    python -m benchmarks.run_suite --database-url mysql+mysqlconnector://root:@localhost:3306/bench
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+import httpx
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app import crud, models
+from app.database import create_db_engine
+from app.question_catalog import QUESTION_TAGS
+from app.schemas import QuestionCreateChild
+
+PASSWORD = "bench"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed(database_url, users, questions, quizzes_per_user, quiz_size, rng):
+    engine = create_db_engine(database_url)
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(models.UserModel),
+            [
+                {
+                    "id": i,
+                    "name": f"user{i}",
+                    "email": f"user{i}@example.com",
+                    "password": PASSWORD,
+                }
+                for i in range(1, users + 1)
+            ],
+        )
+        conn.execute(
+            insert(models.QuestionModel),
+            [
+                {
+                    "id": i,
+                    "question_text": f"問題{i}",
+                    "correct_answer": "a.正解",
+                    "choices": ["a.正解", "b.誤り", "c.誤り", "d.誤り"],
+                    "commentary": f"問題{i}の解説",
+                    "tag": QUESTION_TAGS[i % len(QUESTION_TAGS)],
+                }
+                for i in range(1, questions + 1)
+            ],
+        )
+        conn.execute(
+            insert(models.UserSessionModel),
+            [{"user_id": i, "token": f"seed-{i:08d}"} for i in range(1, users + 1)],
+        )
+    with SessionLocal() as db:
+        for user_id in range(1, users + 1):
+            for _ in range(quizzes_per_user):
+                child = [
+                    QuestionCreateChild(
+                        question_id=question_id, is_correct=rng.random() < 0.6
+                    )
+                    for question_id in rng.sample(range(1, questions + 1), quiz_size)
+                ]
+                crud.insert_user_answers(db, user_id, child)
+        db.commit()
+    engine.dispose()
+
+
+def start_server(module, port, env):
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            module,
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError(f"{module} exited with {process.returncode}")
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError(f"{module} did not start")
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    async def call(self, name, request):
+        start = time.perf_counter()
+        try:
+            response = await request
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        finally:
+            self.latencies[name].append(time.perf_counter() - start)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+            return None
+        return response
+
+
+async def virtual_user(
+    client, recorder, user_id, quiz_size, feedback_ratio, stop_at, rng
+):
+    while time.perf_counter() < stop_at:
+        response = await recorder.call(
+            "POST /login/",
+            client.post(
+                "/login/",
+                json={"email": f"user{user_id}@example.com", "password": PASSWORD},
+            ),
+        )
+        if response is None:
+            continue
+        token = response.json()["token"]
+
+        response = await recorder.call(
+            "POST /quizzes", client.post("/quizzes", json={"count": quiz_size})
+        )
+        if response is None:
+            continue
+        quiz = response.json()
+        question_ids = [question["id"] for question in quiz["questions"]]
+
+        await recorder.call(
+            "GET /questions",
+            client.get("/questions", params={"ids": ",".join(map(str, question_ids))}),
+        )
+        await recorder.call(
+            "GET /questions/{question_id}",
+            client.get(f"/questions/{rng.choice(question_ids)}"),
+        )
+
+        answers = [
+            {"question_id": question_id, "is_correct": rng.random() < 0.6}
+            for question_id in question_ids
+        ]
+        await recorder.call(
+            "POST /results/",
+            client.post(
+                "/results/",
+                json={
+                    "token": token,
+                    "quize_list_uuid": quiz["quize_list_uuid"],
+                    "child": answers,
+                },
+            ),
+        )
+        await recorder.call(
+            "GET /user_history_uuid",
+            client.get("/user_history_uuid", params={"token": token}),
+        )
+        await recorder.call(
+            "GET /user_history_by_uuid/",
+            client.get(
+                "/user_history_by_uuid/",
+                params={"token": token, "quize_list_uuid": quiz["quize_list_uuid"]},
+            ),
+        )
+        if rng.random() < feedback_ratio:
+            await recorder.call(
+                "POST /generate-feedback",
+                client.post(
+                    "/generate-feedback",
+                    json={"token": token, "quize_list_uuid": quiz["quize_list_uuid"]},
+                ),
+            )
+
+
+def percentile(values, q):
+    index = min(len(values) - 1, max(0, int(round(q * len(values))) - 1))
+    return values[index]
+
+
+def summarize(recorder, elapsed):
+    report = {}
+    for name, latencies in sorted(recorder.latencies.items()):
+        latencies = sorted(latencies)
+        report[name] = {
+            "requests": len(latencies),
+            "errors": recorder.errors[name],
+            "rps": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+        }
+    return report
+
+
+async def drive(base_url, args):
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        start = time.perf_counter()
+        stop_at = start + args.duration
+        await asyncio.gather(
+            *(
+                virtual_user(
+                    client,
+                    recorder,
+                    rng.randint(1, args.users),
+                    args.quiz_size,
+                    args.feedback_ratio,
+                    stop_at,
+                    random.Random(rng.random()),
+                )
+                for _ in range(args.concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+    return summarize(recorder, elapsed), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--questions", type=int, default=287)
+    parser.add_argument("--quizzes-per-user", type=int, default=5)
+    parser.add_argument("--quiz-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--feedback-ratio", type=float, default=0.2)
+    parser.add_argument("--llm-latency", type=float, default=0.5)
+    parser.add_argument("--llm-token-rate", type=float, default=0)
+    parser.add_argument("--llm-error-rate", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="write JSON results here")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{tmpdir.name}/bench.db"
+    print(f"seeding {database_url} ...", flush=True)
+    t0 = time.perf_counter()
+    seed(
+        database_url,
+        args.users,
+        args.questions,
+        args.quizzes_per_user,
+        args.quiz_size,
+        random.Random(args.seed),
+    )
+    print(f"seeded in {time.perf_counter() - t0:.1f}s", flush=True)
+
+    stub_port = free_port()
+    app_port = free_port()
+    env = dict(os.environ)
+    env.update(
+        {
+            "DATABASE_URL": database_url,
+            "OLLAMA_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+            "STUB_LATENCY": str(args.llm_latency),
+            "STUB_TOKEN_RATE": str(args.llm_token_rate),
+            "STUB_ERROR_RATE": str(args.llm_error_rate),
+            "STUB_SEED": str(args.seed),
+        }
+    )
+    processes = []
+    try:
+        processes.append(start_server("benchmarks.ollama_stub:app", stub_port, env))
+        processes.append(start_server("app.main:app", app_port, env))
+        report, elapsed = asyncio.run(drive(f"http://127.0.0.1:{app_port}", args))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+        tmpdir.cleanup()
+
+    print(
+        f"{'endpoint':<32}{'reqs':>8}{'err':>6}{'req/s':>9}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    )
+    for name, row in report.items():
+        print(
+            f"{name:<32}{row['requests']:>8}{row['errors']:>6}{row['rps']:>9.1f}"
+            f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['p99_ms']:>9.1f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "config": vars(args),
+                    "python": platform.python_version(),
+                    "elapsed_s": elapsed,
+                    "endpoints": report,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""add quiz_attempts
+
+Revision ID: 77499270a239
+Revises: 7dd13766a0b6
+Create Date: 2026-10-18 11:40:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "77499270a239"
+down_revision: Union[str, None] = "7dd13766a0b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "quiz_attempts",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("quize_list_uuid", sa.String(length=255), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=False),
+        sa.Column("finished_at", sa.DateTime(), nullable=False),
+        sa.Column("question_count", sa.Integer(), nullable=False),
+        sa.Column("correct_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("quize_list_uuid"),
+    )
+    op.create_index(
+        "ix_quiz_attempts_user_id_finished_at",
+        "quiz_attempts",
+        ["user_id", "finished_at"],
+        unique=False,
+    )
+
+    # 既存の解答から集計を作る
+    op.execute("""
+        INSERT INTO quiz_attempts
+            (quize_list_uuid, user_id, started_at, finished_at,
+             question_count, correct_count)
+        SELECT quize_list_uuid, MIN(user_id), MIN(answered_at), MAX(answered_at),
+               COUNT(*), SUM(CASE WHEN is_correct THEN 1 ELSE 0 END)
+        FROM user_answers
+        GROUP BY quize_list_uuid
+        """)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_quiz_attempts_user_id_finished_at", table_name="quiz_attempts")
+    op.drop_table("quiz_attempts")
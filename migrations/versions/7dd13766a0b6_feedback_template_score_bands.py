@@ -0,0 +1,75 @@
+"""feedback template score bands
+
+Revision ID: 7dd13766a0b6
+Revises: 9c19632d3bdc
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7dd13766a0b6"
+down_revision: Union[str, None] = "9c19632d3bdc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TAGS = ["深層学習", "法規・倫理", "基礎数学", "AI概論", "機械学習"]
+
+# (min_rate, max_rate, feedback)
+BANDS = [
+    (
+        0,
+        39,
+        "{tag}の正答率は{correct_count}/{total_count}（{rate}%）です。基礎用語の理解が不十分な可能性があります。解説を読み直し、同じ分野の問題を繰り返し解きましょう。",
+    ),
+    (
+        40,
+        69,
+        "{tag}の正答率は{correct_count}/{total_count}（{rate}%）です。基本は押さえられています。間違えた問題の解説を確認し、曖昧な知識を整理しましょう。",
+    ),
+    (
+        70,
+        100,
+        "{tag}の正答率は{correct_count}/{total_count}（{rate}%）です。よく理解できています。この調子で応用問題にも挑戦しましょう。",
+    ),
+]
+
+
+def upgrade() -> None:
+    op.add_column(
+        "feedback_templates", sa.Column("min_rate", sa.Integer(), nullable=True)
+    )
+    op.add_column(
+        "feedback_templates", sa.Column("max_rate", sa.Integer(), nullable=True)
+    )
+
+    feedback_templates = sa.table(
+        "feedback_templates",
+        sa.column("tag", sa.String),
+        sa.column("feedback", sa.String),
+        sa.column("min_rate", sa.Integer),
+        sa.column("max_rate", sa.Integer),
+    )
+    op.bulk_insert(
+        feedback_templates,
+        [
+            {
+                "tag": tag,
+                "feedback": feedback,
+                "min_rate": min_rate,
+                "max_rate": max_rate,
+            }
+            for tag in TAGS
+            for min_rate, max_rate, feedback in BANDS
+        ],
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.text("DELETE FROM feedback_templates WHERE min_rate IS NOT NULL"))
+    op.drop_column("feedback_templates", "max_rate")
+    op.drop_column("feedback_templates", "min_rate")
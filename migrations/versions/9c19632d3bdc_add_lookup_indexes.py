@@ -0,0 +1,43 @@
+"""add lookup indexes
+
+Revision ID: 9c19632d3bdc
+Revises: af9fcdbbf2c7
+Create Date: 2026-10-18 10:20:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9c19632d3bdc"
+down_revision: Union[str, None] = "af9fcdbbf2c7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_user_sessions_token", "user_sessions", ["token"], unique=False)
+    op.create_index(
+        "ix_user_answers_quize_list_uuid",
+        "user_answers",
+        ["quize_list_uuid"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_user_answers_user_id_quize_list_uuid_answered_at",
+        "user_answers",
+        ["user_id", "quize_list_uuid", "answered_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_user_answers_user_id_quize_list_uuid_answered_at",
+        table_name="user_answers",
+    )
+    op.drop_index("ix_user_answers_quize_list_uuid", table_name="user_answers")
+    op.drop_index("ix_user_sessions_token", table_name="user_sessions")
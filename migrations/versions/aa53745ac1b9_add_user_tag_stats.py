@@ -0,0 +1,47 @@
+"""add user_tag_stats
+
+Revision ID: aa53745ac1b9
+Revises: 77499270a239
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "aa53745ac1b9"
+down_revision: Union[str, None] = "77499270a239"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_tag_stats",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("tag", sa.String(length=255), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("correct_count", sa.Integer(), nullable=False),
+        sa.Column("last_answered_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id", "tag"),
+    )
+
+    # 既存の解答から集計を作る
+    op.execute("""
+        INSERT INTO user_tag_stats
+            (user_id, tag, attempts, correct_count, last_answered_at)
+        SELECT a.user_id, q.tag, COUNT(*),
+               SUM(CASE WHEN a.is_correct THEN 1 ELSE 0 END), MAX(a.answered_at)
+        FROM user_answers a
+        JOIN questions q ON q.id = a.question_id
+        WHERE q.tag IS NOT NULL
+        GROUP BY a.user_id, q.tag
+        """)
+
+
+def downgrade() -> None:
+    op.drop_table("user_tag_stats")
@@ -0,0 +1,5 @@
+import os
+
+# appのimport時にDBエンジンを作るので、テストではインメモリのSQLiteを使う
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("USE_ASYNC_DB", "0")
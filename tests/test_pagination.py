@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.pagination import (
+    PAGE_LIMIT_DEFAULT,
+    PAGE_LIMIT_MAX,
+    decode_cursor,
+    decode_datetime_id_cursor,
+    decode_id_cursor,
+    encode_cursor,
+    fetch_limit,
+    page_limit,
+)
+
+
+def test_id_cursor_round_trip():
+    cursor = encode_cursor(12345)
+    assert "=" not in cursor
+    assert decode_id_cursor(cursor) == 12345
+
+
+def test_datetime_id_cursor_round_trip():
+    finished_at = datetime(2026, 10, 18, 12, 30, 15, 123456)
+    cursor = encode_cursor(finished_at, 42)
+    assert decode_datetime_id_cursor(cursor) == (finished_at, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not base64!",
+        encode_cursor("abc"),
+        encode_cursor(1, 2),
+        encode_cursor(1.5),
+    ],
+)
+def test_invalid_id_cursor(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_id_cursor(cursor)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        encode_cursor(42),
+        encode_cursor("yesterday", 42),
+        encode_cursor(datetime(2026, 10, 18), "42"),
+        encode_cursor(None, 42),
+    ],
+)
+def test_invalid_datetime_id_cursor(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_datetime_id_cursor(cursor)
+    assert exc_info.value.status_code == 400
+
+
+def test_decode_cursor_requires_list():
+    with pytest.raises(HTTPException):
+        decode_cursor("eyJhIjogMX0", 1)  # {"a": 1}
+
+
+def test_page_limit():
+    # limitもcursorもなければ全件
+    assert page_limit(None, None) is None
+    assert fetch_limit(None) is None
+    assert page_limit(None, encode_cursor(1)) == PAGE_LIMIT_DEFAULT
+    assert page_limit(10, None) == 10
+    assert fetch_limit(10) == 11
+    for limit in (0, PAGE_LIMIT_MAX + 1):
+        with pytest.raises(HTTPException):
+            page_limit(limit, None)
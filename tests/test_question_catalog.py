@@ -0,0 +1,25 @@
+import pytest
+
+from app.question_catalog import etag_matches
+
+ETAG = '"0123456789abcdef"'
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        ETAG,
+        "*",
+        f"W/{ETAG}",
+        f'"other", {ETAG}',
+        f'"other",{ETAG}',
+        f'"other" ,  W/{ETAG} ',
+    ],
+)
+def test_etag_matches(if_none_match):
+    assert etag_matches(if_none_match, ETAG)
+
+
+@pytest.mark.parametrize("if_none_match", ["", '"other"', '"other", W/"x"', "0123"])
+def test_etag_does_not_match(if_none_match):
+    assert not etag_matches(if_none_match, ETAG)
@@ -0,0 +1,119 @@
+import io
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.database import create_db_engine
+from app.restore_dump import DumpError, DumpReader, parse_dump, restore
+
+DUMP = """-- MySQL dump 10.13
+/*!40101 SET NAMES utf8mb4 */;
+DROP TABLE IF EXISTS `questions`;
+CREATE TABLE `questions` (
+  `id` int NOT NULL AUTO_INCREMENT,
+  `question_text` varchar(500) NOT NULL,
+  `choices` json NOT NULL,
+  `tag` varchar(255) DEFAULT NULL,
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+LOCK TABLES `questions` WRITE;
+INSERT INTO `questions` VALUES (1,'深層学習とは何か？','[\\"a\\", \\"b\\"]','深層学習'),(2,'It\\'s a \\\\ test;\\n','[]',NULL),(3,'セミコロン; と ''引用符''','[\\"x\\"]','AI概論');
+UNLOCK TABLES;
+INSERT INTO `user_answers` (`id`, `score`, `payload`) VALUES (10,-1.5e3,_binary 0x4869),(11,42,0x);
+"""
+
+EXPECTED = [
+    ("create", "questions", ["id", "question_text", "choices", "tag"]),
+    (
+        "row",
+        "questions",
+        {
+            "id": 1,
+            "question_text": "深層学習とは何か？",
+            "choices": '["a", "b"]',
+            "tag": "深層学習",
+        },
+    ),
+    (
+        "row",
+        "questions",
+        {"id": 2, "question_text": "It's a \\ test;\n", "choices": "[]", "tag": None},
+    ),
+    (
+        "row",
+        "questions",
+        {
+            "id": 3,
+            "question_text": "セミコロン; と '引用符'",
+            "choices": '["x"]',
+            "tag": "AI概論",
+        },
+    ),
+    ("row", "user_answers", {"id": 10, "score": -1500.0, "payload": b"Hi"}),
+    ("row", "user_answers", {"id": 11, "score": 42, "payload": b""}),
+]
+
+
+def parse(text: str, read_size: int) -> list:
+    reader = DumpReader(io.BytesIO(text.encode()), read_size=read_size)
+    return list(parse_dump(reader))
+
+
+def test_parse_dump():
+    assert parse(DUMP, 64 * 1024) == EXPECTED
+
+
+# 値・文・マルチバイト文字が読み込みの境界をまたいでも結果が変わらないこと
+@pytest.mark.parametrize("read_size", [1, 2, 3, 5, 7, 16, 64, 127])
+def test_parse_dump_across_buffer_boundaries(read_size):
+    assert parse(DUMP, read_size) == EXPECTED
+
+
+def test_insert_before_create_table():
+    with pytest.raises(DumpError):
+        parse("INSERT INTO `questions` VALUES (1);", 16)
+
+
+def test_truncated_values():
+    with pytest.raises(DumpError):
+        parse("INSERT INTO `t` (`id`) VALUES (1,", 4)
+
+
+# CREATE TABLEを含まないデータだけのダンプ（mysqldump --no-create-info --complete-insert）
+DATA_ONLY_DUMP = """INSERT INTO `users` (`id`, `name`, `email`, `password`) VALUES (1,'u1','u1@example.com','x'),(2,'u2','u2@example.com','x');
+INSERT INTO `questions` (`id`, `question_text`, `correct_answer`, `choices`, `commentary`, `tag`) VALUES (1,'q1','a','[\\"a\\", \\"b\\"]','','深層学習'),(2,'q2','b','[\\"a\\", \\"b\\"]','','AI概論');
+INSERT INTO `user_answers` (`id`, `user_id`, `question_id`, `is_correct`, `quize_list_uuid`, `answered_at`) VALUES (1,1,1,1,'quiz-1','2026-10-18 10:00:00'),(2,1,2,0,'quiz-1','2026-10-18 10:00:00'),(3,2,1,1,'quiz-2','2026-10-18 11:00:00');
+"""
+
+
+def test_restore_data_only_dump(tmp_path):
+    path = tmp_path / "dump.txt"
+    path.write_text(DATA_ONLY_DUMP, encoding="utf-8")
+    engine = create_db_engine("sqlite://")
+    models.Base.metadata.create_all(bind=engine)
+
+    # 1行ずつコミットして、テーブルの途中のチャンクも数えられること
+    counts = restore(str(path), engine, chunk_size=1)
+
+    assert counts == {
+        "users": 2,
+        "questions": 2,
+        "user_answers": 3,
+        "quiz_attempts": 2,
+        "user_tag_stats": 3,
+    }
+    with Session(engine) as db:
+        attempt = db.scalar(
+            select(models.QuizAttemptModel).where(
+                models.QuizAttemptModel.quize_list_uuid == "quiz-1"
+            )
+        )
+        assert (attempt.user_id, attempt.question_count, attempt.correct_count) == (
+            1,
+            2,
+            1,
+        )
+        assert db.get(models.QuestionModel, 1).choices == ["a", "b"]
+    engine.dispose()
@@ -0,0 +1,114 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app import crud, models
+from app.database import create_db_engine
+from app.schemas import QuestionCreateChild
+
+TAGS = {1: "深層学習", 2: "深層学習", 3: "基礎数学", 4: None}
+
+
+@pytest.fixture
+def db():
+    engine = create_db_engine("sqlite://")
+    models.Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        session.add(
+            models.UserModel(id=1, name="u", email="u@example.com", password="x")
+        )
+        for question_id, tag in TAGS.items():
+            session.add(
+                models.QuestionModel(
+                    id=question_id,
+                    question_text=f"q{question_id}",
+                    correct_answer="a",
+                    choices=["a", "b"],
+                    commentary="",
+                    tag=tag,
+                )
+            )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def answers(*results) -> list[QuestionCreateChild]:
+    return [
+        QuestionCreateChild(question_id=question_id, is_correct=is_correct)
+        for question_id, is_correct in results
+    ]
+
+
+def stats(db) -> dict[str, tuple[int, int]]:
+    return {
+        stat.tag: (stat.attempts, stat.correct_count)
+        for stat in db.scalars(crud.tag_stats_query(1))
+    }
+
+
+def test_insert_and_delete_tag_stats(db):
+    first = crud.insert_user_answers(db, 1, answers((1, True), (2, False), (3, True)))
+    db.commit()
+    assert stats(db) == {"基礎数学": (1, 1), "深層学習": (2, 1)}
+
+    # 2回目は既存の行に加算される（タグのない問題は数えない）
+    second = crud.insert_user_answers(db, 1, answers((1, True), (2, True), (4, True)))
+    db.commit()
+    assert stats(db) == {"基礎数学": (1, 1), "深層学習": (4, 3)}
+
+    # 解答数が0になったタグの行は消える
+    assert crud.delete_quiz_answers(db, 1, first)
+    db.commit()
+    assert stats(db) == {"深層学習": (2, 2)}
+
+    assert crud.delete_quiz_answers(db, 1, second)
+    db.commit()
+    assert stats(db) == {}
+    assert db.scalar(select(func.count()).select_from(models.UserAnswerModel)) == 0
+
+
+def test_delete_twice_subtracts_once(db):
+    first = crud.insert_user_answers(db, 1, answers((1, True), (3, False)))
+    second = crud.insert_user_answers(db, 1, answers((1, False)))
+    db.commit()
+
+    assert crud.delete_quiz_answers(db, 1, first)
+    db.commit()
+    # 同じクイズの2回目の削除（ダブルクリックなど）は集計を変えない
+    assert not crud.delete_quiz_answers(db, 1, first)
+    db.commit()
+    assert stats(db) == {"深層学習": (1, 0)}
+    assert crud.delete_quiz_answers(db, 1, second)
+
+
+@pytest.mark.parametrize(
+    "dialect, clause",
+    [
+        (mysql.dialect(), "ON DUPLICATE KEY UPDATE"),
+        (sqlite.dialect(), "ON CONFLICT (user_id, tag) DO UPDATE"),
+        (postgresql.dialect(), "ON CONFLICT (user_id, tag) DO UPDATE"),
+    ],
+)
+def test_tag_stats_upsert_increments(dialect, clause):
+    rows = [
+        {"question_id": 1, "is_correct": True},
+        {"question_id": 3, "is_correct": False},
+    ]
+    statement = crud.build_tag_stats_upsert(dialect, 1, rows, TAGS, datetime.now())
+    sql = str(statement.compile(dialect=dialect))
+    assert clause in sql
+    # 上書きではなく既存の値への加算になっていること
+    assert "user_tag_stats.attempts +" in sql
+    assert "user_tag_stats.correct_count +" in sql
+
+
+def test_tag_stats_upsert_without_tags():
+    rows = [{"question_id": 4, "is_correct": True}]
+    assert (
+        crud.build_tag_stats_upsert(sqlite.dialect(), 1, rows, TAGS, datetime.now())
+        is None
+    )